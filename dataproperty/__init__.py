@@ -5,13 +5,34 @@
 from .__version__ import __author__, __copyright__, __email__, __license__, __version__
 from ._align import Align
 from ._align_getter import align_getter
+from ._ansi_escape import AnsiEscapeHandling
 from ._column import ColumnDataProperty
-from ._common import MAX_STRICT_LEVEL_MAP, MIN_STRICT_LEVEL_MAP, NOT_QUOTING_FLAGS, DefaultValue
+from ._column_arrays import ColumnArrays
+from ._common import (
+    MAX_STRICT_LEVEL_MAP,
+    MIN_STRICT_LEVEL_MAP,
+    NOT_QUOTING_FLAGS,
+    CacheInfo,
+    DefaultValue,
+)
 from ._container import MinMaxContainer
 from ._dataproperty import DataProperty
-from ._extractor import DataPropertyExtractor, DataPropertyMatrix, MatrixFormatting
+from ._extractor import (
+    DataPropertyExtractor,
+    DataPropertyMatrix,
+    ExecutorBackend,
+    MatrixFormatting,
+)
 from ._formatter import Format
-from ._function import calc_ascii_char_width, get_integer_digit, get_number_of_digit
+from ._function import (
+    calc_ascii_char_width,
+    calc_ascii_char_widths,
+    clear_ascii_char_width_cache,
+    get_ascii_char_width_cache_info,
+    get_integer_digit,
+    get_number_of_digit,
+    set_ascii_char_width_cache_size,
+)
 from ._line_break import LineBreakHandling
 from ._preprocessor import Preprocessor
 from .logger import set_logger
@@ -20,18 +41,26 @@ from .logger import set_logger
 __all__ = (
     "Align",
     "align_getter",
+    "AnsiEscapeHandling",
+    "CacheInfo",
+    "ColumnArrays",
     "ColumnDataProperty",
     "DataProperty",
     "DataPropertyExtractor",
     "DataPropertyMatrix",
+    "ExecutorBackend",
     "Format",
     "LineBreakHandling",
     "MatrixFormatting",
     "MinMaxContainer",
     "Preprocessor",
     "calc_ascii_char_width",
+    "calc_ascii_char_widths",
+    "clear_ascii_char_width_cache",
+    "get_ascii_char_width_cache_info",
     "get_integer_digit",
     "get_number_of_digit",
+    "set_ascii_char_width_cache_size",
     "MAX_STRICT_LEVEL_MAP",
     "MIN_STRICT_LEVEL_MAP",
     "NOT_QUOTING_FLAGS",
@@ -0,0 +1,13 @@
+from enum import Enum, unique
+
+
+@unique
+class AnsiEscapeHandling(Enum):
+    # detect escape sequences and measure strings without them
+    AUTO = 0
+
+    # treat escape sequences as ordinary characters
+    OFF = 1
+
+    # remove escape sequences from strings
+    STRIP = 2
@@ -27,6 +27,7 @@ class DataPeropertyBase(DataPeropertyInterface):
         "_decimal_places",
         "_east_asian_ambiguous_width",
         "_formatter",
+        "_is_grapheme_cluster_aware",
         "_typecode",
         "__format_str",
     )
@@ -74,9 +75,11 @@ class DataPeropertyBase(DataPeropertyInterface):
         is_formatting_float: bool,
         datetime_format_str: str,
         east_asian_ambiguous_width: int,
+        is_grapheme_cluster_aware: bool = False,
     ) -> None:
         self._decimal_places: Optional[int] = None
         self._east_asian_ambiguous_width = east_asian_ambiguous_width
+        self._is_grapheme_cluster_aware = is_grapheme_cluster_aware
         self._typecode: Optional[Typecode] = None
 
         self._datetime_format_str = datetime_format_str
@@ -1,3 +1,6 @@
+import math
+from collections.abc import Iterable
+from decimal import Decimal
 from typing import Any, Optional
 
 from mbstrdecoder import MultiByteStrDecoder
@@ -7,26 +10,38 @@ from ._align import Align
 from ._align_getter import align_getter
 from ._base import DataPeropertyBase
 from ._common import DefaultValue
-from ._container import ListContainer, MinMaxContainer
+from ._container import AbstractContainer, ListContainer, MinMaxContainer
 from ._dataproperty import DataProperty
-from ._function import calc_ascii_char_width
+from ._function import calc_ascii_char_width, calc_ascii_char_widths
 from .typing import FloatType
 
 
+def _is_nan(value: Any) -> bool:
+    if isinstance(value, Decimal):
+        return value.is_nan()
+
+    return isinstance(value, float) and math.isnan(value)
+
+
 class ColumnDataProperty(DataPeropertyBase):
     __slots__ = (
         "__header_ascii_char_width",
         "__body_ascii_char_width",
+        "__bit_length",
         "__column_index",
-        "__dp_list",
+        "__dp_map",
         "__float_type",
         "__format_map",
         "__is_calculate",
+        "__is_formatting_float",
+        "__is_streaming",
         "__max_precision",
         "__minmax_integer_digits",
         "__minmax_decimal_places",
         "__minmax_additional_format_len",
+        "__sample_dp_map",
         "__typecode_bitmap",
+        "__width_format_key",
     )
 
     @property
@@ -38,19 +53,16 @@ class ColumnDataProperty(DataPeropertyBase):
         if self.typecode != Typecode.INTEGER:
             return None
 
-        bit_length = 0
-        for value_dp in self.__dp_list:
-            try:
-                bit_length = max(bit_length, int.bit_length(value_dp.data))
-            except TypeError:
-                pass
-
-        return bit_length
+        return self.__bit_length
 
     @property
     def column_index(self) -> int:
         return self.__column_index
 
+    @property
+    def is_streaming(self) -> bool:
+        return self.__is_streaming
+
     @property
     def decimal_places(self) -> Optional[int]:
         return self._decimal_places
@@ -64,7 +76,7 @@ class ColumnDataProperty(DataPeropertyBase):
         return self.__minmax_integer_digits
 
     @property
-    def minmax_decimal_places(self) -> ListContainer:
+    def minmax_decimal_places(self) -> AbstractContainer:
         return self.__minmax_decimal_places
 
     @property
@@ -81,12 +93,15 @@ class ColumnDataProperty(DataPeropertyBase):
         datetime_format_str: str = DefaultValue.DATETIME_FORMAT,
         east_asian_ambiguous_width: int = 1,
         max_precision: int = DefaultValue.MAX_PRECISION,
+        is_streaming: bool = False,
+        is_grapheme_cluster_aware: bool = False,
     ) -> None:
         super().__init__(
             format_flags=format_flags,
             is_formatting_float=is_formatting_float,
             datetime_format_str=datetime_format_str,
             east_asian_ambiguous_width=east_asian_ambiguous_width,
+            is_grapheme_cluster_aware=is_grapheme_cluster_aware,
         )
 
         self.__header_ascii_char_width = 0
@@ -96,9 +111,17 @@ class ColumnDataProperty(DataPeropertyBase):
         self.__float_type = float_type
 
         self.__is_calculate = True
-        self.__dp_list: list[DataProperty] = []
+        self.__is_formatting_float = is_formatting_float
+        self.__is_streaming = is_streaming
+        self.__bit_length = 0
+        self.__dp_map: dict[int, DataProperty] = {}
+        self.__sample_dp_map: dict[tuple[Typecode, int], DataProperty] = {}
+        self.__width_format_key: Optional[tuple[Optional[Typecode], Optional[int]]] = None
         self.__minmax_integer_digits = MinMaxContainer()
-        self.__minmax_decimal_places = ListContainer()
+        # streaming profiles keep only running aggregates
+        self.__minmax_decimal_places: AbstractContainer = (
+            MinMaxContainer() if is_streaming else ListContainer()
+        )
         self.__minmax_additional_format_len = MinMaxContainer()
         self.__max_precision = max_precision
 
@@ -189,6 +212,15 @@ class ColumnDataProperty(DataPeropertyBase):
         self.__header_ascii_char_width = header_db.ascii_char_width
 
     def update_body(self, value_dp: DataProperty) -> None:
+        if not self.__is_streaming:
+            # instances are shared between cells that have the same value when the
+            # values are cached or dictionary-encoded by the extractor
+            if id(value_dp) in self.__dp_map:
+                self.__update_repeated_body(value_dp)
+                return
+
+            self.__dp_map[id(value_dp)] = value_dp
+
         if value_dp.is_include_ansi_escape:
             assert value_dp.no_ansi_escape_dp
             value_dp = value_dp.no_ansi_escape_dp
@@ -203,8 +235,25 @@ class ColumnDataProperty(DataPeropertyBase):
 
         self.__minmax_additional_format_len.update(value_dp.additional_format_len)
 
-        self.__dp_list.append(value_dp)
-        self.__update_ascii_char_width()
+        try:
+            self.__bit_length = max(self.__bit_length, int.bit_length(value_dp.data))
+        except TypeError:
+            pass
+
+        if self.__is_streaming:
+            self.__update_sample_dp(value_dp)
+
+        self.__update_ascii_char_width(value_dp)
+
+    def __update_repeated_body(self, value_dp: DataProperty) -> None:
+        # the list of decimal places is the only aggregation that depends on
+        # the number of occurrences of a value
+        if value_dp.is_include_ansi_escape:
+            assert value_dp.no_ansi_escape_dp
+            value_dp = value_dp.no_ansi_escape_dp
+
+        if value_dp.typecode in (Typecode.REAL_NUMBER, Typecode.INTEGER):
+            self.__minmax_decimal_places.update(value_dp.decimal_places)
 
     def merge(self, column_dp: "ColumnDataProperty") -> None:
         self.__typecode_bitmap |= column_dp.typecode.value
@@ -256,20 +305,78 @@ class ColumnDataProperty(DataPeropertyBase):
 
         return False
 
+    def __update_sample_dp(self, value_dp: DataProperty) -> None:
+        # keep only values that can be the widest when formatted with the column format:
+        # minimum/maximum values for numbers and the widest value for other types
+        typecode = value_dp.typecode
+
+        if typecode == Typecode.REAL_NUMBER and (
+            # widths of real numbers depend on the digits of each value when the format
+            # is not fixed-precision. NaN can not be compared with the other numbers.
+            not self.__is_formatting_float or _is_nan(value_dp.data)
+        ):
+            widest_key = (typecode, 0)
+            widest_dp = self.__sample_dp_map.get(widest_key)
+            if widest_dp is None:
+                self.__sample_dp_map[widest_key] = value_dp
+                return
+
+            width = self.__calc_value_ascii_char_width(value_dp)
+            if width > self.__calc_value_ascii_char_width(widest_dp):
+                self.__sample_dp_map[widest_key] = value_dp
+
+            return
+
+        if typecode in (Typecode.INTEGER, Typecode.REAL_NUMBER):
+            min_key = (typecode, -1)
+            min_dp = self.__sample_dp_map.get(min_key)
+            if min_dp is None or value_dp.data < min_dp.data:
+                self.__sample_dp_map[min_key] = value_dp
+
+            max_key = (typecode, 1)
+            max_dp = self.__sample_dp_map.get(max_key)
+            if max_dp is None or value_dp.data > max_dp.data:
+                self.__sample_dp_map[max_key] = value_dp
+
+            return
+
+        key = (typecode, 0)
+        widest_dp = self.__sample_dp_map.get(key)
+        if widest_dp is None or value_dp.ascii_char_width > widest_dp.ascii_char_width:
+            self.__sample_dp_map[key] = value_dp
+
     def __calc_body_ascii_char_width(self) -> int:
         width_list = [self.__body_ascii_char_width]
 
-        for value_dp in self.__dp_list:
-            if value_dp.is_include_ansi_escape:
-                assert value_dp.no_ansi_escape_dp
-                value_dp = value_dp.no_ansi_escape_dp
+        if self.__is_streaming:
+            body_dp_list: Iterable[DataProperty] = self.__sample_dp_map.values()
+        else:
+            body_dp_list = self.__dp_map.values()
 
-            width_list.append(
-                calc_ascii_char_width(self.dp_to_str(value_dp), self._east_asian_ambiguous_width)
+        width_list.extend(
+            calc_ascii_char_widths(
+                [self.__to_visible_str(value_dp) for value_dp in body_dp_list],
+                self._east_asian_ambiguous_width,
+                self._is_grapheme_cluster_aware,
             )
+        )
 
         return max(width_list)
 
+    def __calc_value_ascii_char_width(self, value_dp: DataProperty) -> int:
+        return calc_ascii_char_width(
+            self.__to_visible_str(value_dp),
+            self._east_asian_ambiguous_width,
+            self._is_grapheme_cluster_aware,
+        )
+
+    def __to_visible_str(self, value_dp: DataProperty) -> str:
+        if value_dp.is_include_ansi_escape:
+            assert value_dp.no_ansi_escape_dp
+            value_dp = value_dp.no_ansi_escape_dp
+
+        return self.dp_to_str(value_dp)
+
     def __calc_decimal_places(self) -> Optional[int]:
         if self.minmax_decimal_places.max_value is None:
             return None
@@ -317,17 +424,31 @@ class ColumnDataProperty(DataPeropertyBase):
 
         return Typecode.STRING
 
-    def __update_ascii_char_width(self) -> None:
+    def __update_ascii_char_width(self, value_dp: Optional[DataProperty] = None) -> None:
         if not self.__is_calculate:
             return
 
+        # widths of the values that already measured do not change unless the format changes
+        width_format_key = (self._typecode, self._decimal_places)
+        if value_dp is not None and width_format_key == self.__width_format_key:
+            self.__body_ascii_char_width = max(
+                self.__body_ascii_char_width, self.__calc_value_ascii_char_width(value_dp)
+            )
+            return
+
         self.__body_ascii_char_width = self.__calc_body_ascii_char_width()
+        self.__width_format_key = width_format_key
 
     def __update_decimal_places(self) -> None:
         if not self.__is_calculate:
             return
 
-        self._decimal_places = self.__calc_decimal_places()
+        decimal_places = self.__calc_decimal_places()
+        if decimal_places == self._decimal_places:
+            # the format map was made with the same decimal places
+            return
+
+        self._decimal_places = decimal_places
         self.__format_map = self._formatter.make_format_map(decimal_places=self._decimal_places)
 
     def __calc_typecode_from_bitmap(self) -> None:
@@ -0,0 +1,158 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from array import array
+from collections.abc import Iterator
+from typing import Any, Final, Optional
+
+from typepy import Typecode
+
+from ._ansi_escape import AnsiEscapeHandling
+from ._common import DefaultValue
+from ._dataproperty import DataProperty
+from .typing import FloatType
+
+
+_NULL_DIGIT: Final = -1
+
+
+class ColumnArrays:
+    """
+    Column-oriented compact representation of the extraction results of a column.
+    Each attribute is a parallel array that has an element for each row of the column.
+    |DataProperty| instances are created only when requested via :py:meth:`get_dp`.
+
+    .. py:attribute:: typecodes
+
+        Values of ``typepy.Typecode`` for each row.
+
+    .. py:attribute:: values
+
+        Converted data for each row.
+
+    .. py:attribute:: integer_digits
+
+        Integer digits for each row. ``-1`` if the data is not a number.
+
+    .. py:attribute:: decimal_places
+
+        Decimal places for each row. ``-1`` if the data is not a number.
+
+    .. py:attribute:: ascii_char_widths
+
+        ASCII character widths for each row.
+    """
+
+    __slots__ = (
+        "__column_index",
+        "__typecodes",
+        "__values",
+        "__integer_digits",
+        "__decimal_places",
+        "__ascii_char_widths",
+        "__float_type",
+        "__datetime_format_str",
+        "__east_asian_ambiguous_width",
+        "__is_grapheme_cluster_aware",
+        "__ansi_escape_handling",
+    )
+
+    @property
+    def column_index(self) -> int:
+        return self.__column_index
+
+    @property
+    def typecodes(self) -> "array[int]":
+        return self.__typecodes
+
+    @property
+    def values(self) -> list[Any]:
+        return self.__values
+
+    @property
+    def integer_digits(self) -> "array[int]":
+        return self.__integer_digits
+
+    @property
+    def decimal_places(self) -> "array[int]":
+        return self.__decimal_places
+
+    @property
+    def ascii_char_widths(self) -> "array[int]":
+        return self.__ascii_char_widths
+
+    def __init__(
+        self,
+        column_index: int,
+        float_type: Optional[FloatType] = None,
+        datetime_format_str: str = DefaultValue.DATETIME_FORMAT,
+        east_asian_ambiguous_width: int = 1,
+        is_grapheme_cluster_aware: bool = False,
+        ansi_escape_handling: AnsiEscapeHandling = AnsiEscapeHandling.AUTO,
+    ) -> None:
+        self.__column_index = column_index
+        self.__float_type = float_type
+        self.__datetime_format_str = datetime_format_str
+        self.__east_asian_ambiguous_width = east_asian_ambiguous_width
+        self.__is_grapheme_cluster_aware = is_grapheme_cluster_aware
+        self.__ansi_escape_handling = ansi_escape_handling
+
+        self.__typecodes = array("H")
+        self.__values: list[Any] = []
+        self.__integer_digits = array("i")
+        self.__decimal_places = array("i")
+        self.__ascii_char_widths = array("i")
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def __repr__(self) -> str:
+        return ", ".join([f"column={self.column_index}", f"rows={len(self)}"])
+
+    def append(self, value_dp: DataProperty) -> None:
+        typecode = value_dp.typecode
+
+        self.__typecodes.append(typecode.value)
+        self.__values.append(value_dp.data)
+        self.__ascii_char_widths.append(value_dp.ascii_char_width)
+
+        if typecode in (Typecode.INTEGER, Typecode.REAL_NUMBER):
+            self.__integer_digits.append(self.__to_digit(value_dp.integer_digits))
+            self.__decimal_places.append(self.__to_digit(value_dp.decimal_places))
+        else:
+            self.__integer_digits.append(_NULL_DIGIT)
+            self.__decimal_places.append(_NULL_DIGIT)
+
+    def get_typecode(self, row_idx: int) -> Typecode:
+        return Typecode(self.__typecodes[row_idx])
+
+    def get_dp(self, row_idx: int) -> DataProperty:
+        """
+        :return: |DataProperty| instance of the ``row_idx`` row.
+        """
+
+        return DataProperty._from_typed_data(
+            self.__values[row_idx],
+            self.get_typecode(row_idx),
+            float_type=self.__float_type,
+            datetime_format_str=self.__datetime_format_str,
+            east_asian_ambiguous_width=self.__east_asian_ambiguous_width,
+            ascii_char_width=self.__ascii_char_widths[row_idx],
+            is_grapheme_cluster_aware=self.__is_grapheme_cluster_aware,
+            ansi_escape_handling=self.__ansi_escape_handling,
+        )
+
+    def iter_dp(self) -> Iterator[DataProperty]:
+        for row_idx in range(len(self)):
+            yield self.get_dp(row_idx)
+
+    def to_dp_list(self) -> list[DataProperty]:
+        return list(self.iter_dp())
+
+    @staticmethod
+    def __to_digit(value: Optional[int]) -> int:
+        if value is None:
+            return _NULL_DIGIT
+
+        return value
@@ -6,7 +6,7 @@ import copy
 import itertools
 from datetime import datetime
 from decimal import Decimal
-from typing import Final
+from typing import Final, NamedTuple
 
 from typepy import StrictLevel, Typecode
 
@@ -67,8 +67,19 @@ class DefaultValue:
     }
 
     MAX_WORKERS: Final = 1
+    CHUNK_SIZE: Final = 1000
+    SCHEMA_SAMPLE_SIZE: Final = 1000
+    DP_CACHE_SIZE: Final = 0
+    ASCII_CHAR_WIDTH_CACHE_SIZE: Final = 4096
     MAX_PRECISION: Final = 100
 
 
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
 def default_datetime_formatter(value: datetime) -> str:
     return value.strftime(DefaultValue.DATETIME_FORMAT)
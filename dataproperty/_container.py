@@ -54,29 +54,28 @@ class AbstractContainer(metaclass=abc.ABCMeta):
 
 
 class ListContainer(AbstractContainer):
-    __slots__ = ("__value_list",)
+    __slots__ = ("__value_list", "__min_value", "__max_value")
 
     @property
     def min_value(self) -> Optional[Decimal]:
-        try:
-            return min(self.__value_list)
-        except ValueError:
-            return None
+        return self.__min_value
 
     @property
     def max_value(self) -> Optional[Decimal]:
-        try:
-            return max(self.__value_list)
-        except ValueError:
-            return None
+        return self.__max_value
 
     @property
     def value_list(self) -> list[Decimal]:
         return self.__value_list
 
     def __init__(self, value_list: Optional[list[Decimal]] = None) -> None:
+        self.__value_list: list[Decimal] = []
+
+        # minimum/maximum values are updated with each value to avoid scanning the list
+        self.__min_value: Optional[Decimal] = None
+        self.__max_value: Optional[Decimal] = None
+
         if value_list is None:
-            self.__value_list: list[Decimal] = []
             return
 
         for value in value_list:
@@ -98,8 +97,15 @@ class ListContainer(AbstractContainer):
 
         self.__value_list.append(store_value)
 
+        if self.__min_value is None or store_value < self.__min_value:
+            self.__min_value = store_value
+        if self.__max_value is None or store_value > self.__max_value:
+            self.__max_value = store_value
+
     def merge(self, value: "AbstractContainer") -> None:
         if not isinstance(value, ListContainer):
+            self.update(value.min_value)
+            self.update(value.max_value)
             return
 
         for v in value.value_list:
@@ -189,8 +195,5 @@ class MinMaxContainer(AbstractContainer):
             self.__max_value = max(self.__max_value, decimal_value)
 
     def merge(self, value: "AbstractContainer") -> None:
-        if not isinstance(value, MinMaxContainer):
-            return
-
         self.update(value.min_value)
         self.update(value.max_value)
@@ -26,6 +26,8 @@ class DataPropertyConverter:
         quoting_flags: Optional[dict[Typecode, bool]] = None,
         float_type: Optional[FloatType] = None,
         strict_level_map: Optional[StrictLevelMap] = None,
+        east_asian_ambiguous_width: int = 1,
+        is_grapheme_cluster_aware: bool = False,
     ) -> None:
         self.__preprocessor = preprocessor
         self.__type_value_map: TypeValueMap = (
@@ -39,12 +41,37 @@ class DataPropertyConverter:
         self.__datetime_format_str = datetime_format_str
         self.__float_type = float_type
         self.__strict_level_map = strict_level_map
+        self.__east_asian_ambiguous_width = east_asian_ambiguous_width
+        self.__is_grapheme_cluster_aware = is_grapheme_cluster_aware
+
+        # results of the conversions that only depend on typecodes
+        self.__type_value_dp_map: dict[Typecode, Optional[DataProperty]] = {}
+
+        # typecodes that may require conversions other than the escape of HTML tags
+        self.__converting_typecodes = frozenset(
+            list(self.__type_value_map)
+            + [typecode for typecode, is_quoting in self.__quoting_flags.items() if is_quoting]
+            + ([Typecode.DATETIME] if datetime_formatter else [])
+        )
 
     def convert(self, dp_value: DataProperty) -> DataProperty:
-        try:
-            return self.__create_dataproperty(self.__convert_value(dp_value))
-        except TypeConversionError:
-            pass
+        typecode = dp_value.typecode
+
+        if (
+            typecode not in self.__converting_typecodes
+            and not self.__preprocessor.is_escape_html_tag
+        ):
+            return dp_value
+
+        if typecode in self.__type_value_map:
+            value_dp = self.__get_type_value_dp(typecode)
+            if value_dp is not None:
+                return value_dp
+        else:
+            try:
+                return self.__create_dataproperty(self.__convert_value(dp_value))
+            except TypeConversionError:
+                pass
 
         if not self.__quoting_flags.get(dp_value.typecode):
             if self.__preprocessor.is_escape_html_tag:
@@ -54,13 +81,47 @@ class DataPropertyConverter:
 
         return self.__create_dataproperty(self.__apply_quote(dp_value.typecode, dp_value.to_str()))
 
+    def __get_type_value_dp(self, typecode: Typecode) -> Optional[DataProperty]:
+        try:
+            return self.__type_value_dp_map[typecode]
+        except KeyError:
+            pass
+
+        try:
+            value_dp: Optional[DataProperty] = self.__create_dataproperty(
+                self.__apply_quote(typecode, self.__type_value_map[typecode])
+            )
+        except TypeConversionError:
+            value_dp = None
+
+        self.__type_value_dp_map[typecode] = value_dp
+
+        return value_dp
+
     def __create_dataproperty(self, value: Any) -> DataProperty:
+        if isinstance(value, str):
+            data, _no_ansi_escape_data = self.__preprocessor.preprocess(value)
+
+            if isinstance(data, str):
+                # strings are always either null strings or strings with the max strict level
+                return DataProperty._from_typed_data(
+                    data,
+                    Typecode.STRING if data.strip() else Typecode.NULL_STRING,
+                    float_type=self.__float_type,
+                    datetime_format_str=self.__datetime_format_str,
+                    east_asian_ambiguous_width=self.__east_asian_ambiguous_width,
+                    is_grapheme_cluster_aware=self.__is_grapheme_cluster_aware,
+                    ansi_escape_handling=self.__preprocessor.ansi_escape_handling,
+                )
+
         return DataProperty(
             value,
             preprocessor=self.__preprocessor,
             float_type=self.__float_type,
             datetime_format_str=self.__datetime_format_str,
             strict_level_map=MAX_STRICT_LEVEL_MAP,
+            east_asian_ambiguous_width=self.__east_asian_ambiguous_width,
+            is_grapheme_cluster_aware=self.__is_grapheme_cluster_aware,
         )
 
     def __apply_quote(self, typecode: Typecode, data: Any) -> Any:
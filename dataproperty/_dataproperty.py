@@ -2,6 +2,7 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+from collections.abc import Callable
 from decimal import Decimal
 from typing import Any, Final, Optional, cast
 
@@ -27,17 +28,102 @@ from typepy.type import AbstractType
 
 from ._align import Align
 from ._align_getter import align_getter
+from ._ansi_escape import AnsiEscapeHandling
 from ._base import DataPeropertyBase
 from ._common import DefaultValue
-from ._function import calc_ascii_char_width, get_number_of_digit
+from ._function import (
+    _has_ansi_escape_char,
+    calc_ascii_char_width,
+    get_number_of_digit,
+    strip_ansi_escape,
+)
 from ._preprocessor import Preprocessor
 from .typing import FloatType, StrictLevelMap, TypeHint
 
 
+TypeCascade = tuple[tuple[type[AbstractType], int], ...]
+_StrTypeCascade = tuple[tuple[type[AbstractType], int, Optional[Callable[[str], bool]]], ...]
+
+_MAX_TYPE_CASCADE_CACHE_SIZE: Final = 64
+
+# numeric conversions of strings also accept underscores, infinities, and (signaling) NaNs
+_NUMBER_HEAD_CHARS: Final = frozenset("0123456789+-.,_iInNsS")
+_INFINITY_HEAD_CHARS: Final = frozenset("+-_iI")
+_NAN_HEAD_CHARS: Final = frozenset("+-_nNsS")
+_IP_ADDRESS_HEAD_CHARS: Final = frozenset("0123456789abcdefABCDEF:")
+_BOOL_HEAD_CHARS: Final = frozenset("tTfF")
+_JSON_WHITESPACES: Final = " \t\n\r"
+
+
+def _is_candidate_head(head: str, head_chars: frozenset[str]) -> bool:
+    # non-ASCII characters are always candidates:
+    # e.g. numeric conversions accept non-ASCII digits
+    return head in head_chars or not head.isascii()
+
+
+def _may_be_number(value: str) -> bool:
+    return _is_candidate_head(value.lstrip()[:1], _NUMBER_HEAD_CHARS)
+
+
+def _may_be_infinity(value: str) -> bool:
+    return _is_candidate_head(value.lstrip()[:1], _INFINITY_HEAD_CHARS)
+
+
+def _may_be_nan(value: str) -> bool:
+    return _is_candidate_head(value.lstrip()[:1], _NAN_HEAD_CHARS)
+
+
+def _may_be_ip_address(value: str) -> bool:
+    return _is_candidate_head(value[:1], _IP_ADDRESS_HEAD_CHARS)
+
+
+def _may_be_bool(value: str) -> bool:
+    return _is_candidate_head(value[:1], _BOOL_HEAD_CHARS)
+
+
+def _may_be_dictionary(value: str) -> bool:
+    # only JSON objects are converted to dictionaries from strings
+    return value.lstrip(_JSON_WHITESPACES)[:1] == "{"
+
+
+def _may_be_null_string(value: str) -> bool:
+    return not value.strip()
+
+
+# minimum strict levels of type classes that never accept string values
+_STR_EXCLUDE_STRICT_LEVEL_MAP: Final[dict[type[AbstractType], int]] = {
+    NoneType: StrictLevel.MIN,
+    Integer: 2,
+    Infinity: 1,
+    Nan: 1,
+    IpAddress: 1,
+    RealNumber: 2,
+    Bool: 2,
+    typepy.List: StrictLevel.MIN,
+    Dictionary: 1,
+    DateTime: 2,
+}
+
+# pre-classifiers of string values that rule out type classes by the leading character.
+# a pre-classifier returns False only if the type class never accepts the value.
+_STR_PRECLASSIFIER_MAP: Final[dict[type[AbstractType], Callable[[str], bool]]] = {
+    Integer: _may_be_number,
+    Infinity: _may_be_infinity,
+    Nan: _may_be_nan,
+    IpAddress: _may_be_ip_address,
+    RealNumber: _may_be_number,
+    Bool: _may_be_bool,
+    Dictionary: _may_be_dictionary,
+    NullString: _may_be_null_string,
+}
+
+
 class DataProperty(DataPeropertyBase):
     __slots__ = (
         "__data",
-        "__no_ansi_escape_data",
+        "__no_ansi_escape_str",
+        "__no_ansi_escape_dp",
+        "__float_type",
         "__align",
         "__integer_digits",
         "__additional_format_len",
@@ -59,6 +145,14 @@ class DataProperty(DataPeropertyBase):
         NullString,
         String,
     ]
+    __type_class_typecodes: Final[list[Typecode]] = [
+        type_class(None, 0).typecode for type_class in __type_class_list
+    ]
+
+    # type detection cascades for each strict level map:
+    # pairs of a type class and a strict level in the order of detection
+    # and the cascades for string values that exclude the type classes never accept strings
+    __type_cascade_map: Final[dict[frozenset, tuple[TypeCascade, _StrTypeCascade]]] = {}
 
     def __init__(
         self,
@@ -70,12 +164,74 @@ class DataProperty(DataPeropertyBase):
         datetime_format_str: str = DefaultValue.DATETIME_FORMAT,
         strict_level_map: Optional[StrictLevelMap] = None,
         east_asian_ambiguous_width: int = 1,
+        is_grapheme_cluster_aware: bool = False,
+    ) -> None:
+        self.__init_attrs(
+            format_flags, datetime_format_str, east_asian_ambiguous_width, is_grapheme_cluster_aware
+        )
+
+        if preprocessor is None:
+            preprocessor = Preprocessor()
+
+        data, no_ansi_escape_data = preprocessor.preprocess(data)
+
+        self.__set_data(data, type_hint, float_type, strict_level_map)
+        self.__set_no_ansi_escape_data(data, no_ansi_escape_data, float_type)
+
+    @classmethod
+    def _from_typed_data(
+        cls,
+        data: Any,
+        typecode: Typecode,
+        float_type: Optional[FloatType] = None,
+        datetime_format_str: str = DefaultValue.DATETIME_FORMAT,
+        east_asian_ambiguous_width: int = 1,
+        ascii_char_width: Optional[int] = None,
+        is_grapheme_cluster_aware: bool = False,
+        ansi_escape_handling: AnsiEscapeHandling = AnsiEscapeHandling.AUTO,
+    ) -> "DataProperty":
+        """
+        Create an instance from the ``data`` that already preprocessed and converted to
+        the type of the ``typecode``. Type detection is not executed.
+        ``ascii_char_width`` is used as the precomputed width of the ``data`` if specified.
+        Escape sequences in the ``data`` are not detected if ``ansi_escape_handling`` is
+        ``AnsiEscapeHandling.OFF``.
+        """
+
+        dp = cls.__new__(cls)
+        dp.__init_attrs(
+            None, datetime_format_str, east_asian_ambiguous_width, is_grapheme_cluster_aware
+        )
+        dp.__data = data
+        dp._typecode = typecode
+        dp.__ascii_char_width = ascii_char_width
+
+        if (
+            ansi_escape_handling != AnsiEscapeHandling.OFF
+            and isinstance(data, str)
+            and _has_ansi_escape_char(data)
+        ):
+            no_ansi_escape_data: Optional[str] = strip_ansi_escape(data)
+        else:
+            no_ansi_escape_data = None
+
+        dp.__set_no_ansi_escape_data(data, no_ansi_escape_data, float_type)
+
+        return dp
+
+    def __init_attrs(
+        self,
+        format_flags: Optional[int],
+        datetime_format_str: str,
+        east_asian_ambiguous_width: int,
+        is_grapheme_cluster_aware: bool,
     ) -> None:
         super().__init__(
             format_flags=format_flags,
             is_formatting_float=True,
             datetime_format_str=datetime_format_str,
             east_asian_ambiguous_width=east_asian_ambiguous_width,
+            is_grapheme_cluster_aware=is_grapheme_cluster_aware,
         )
 
         self.__additional_format_len: Optional[int] = None
@@ -84,17 +240,37 @@ class DataProperty(DataPeropertyBase):
         self.__integer_digits: Optional[int] = None
         self.__length: Optional[int] = None
 
-        if preprocessor is None:
-            preprocessor = Preprocessor()
+    def __set_no_ansi_escape_data(
+        self, data: Any, no_ansi_escape_data: Optional[str], float_type: Optional[FloatType]
+    ) -> None:
+        # the DataProperty of the data without escape sequences is created on demand
+        self.__no_ansi_escape_dp: Optional[DataProperty] = None
+        self.__float_type = float_type
+
+        if (
+            no_ansi_escape_data is None
+            or no_ansi_escape_data is data
+            or len(data) == len(no_ansi_escape_data)
+        ):
+            self.__no_ansi_escape_str: Optional[str] = None
+        else:
+            self.__no_ansi_escape_str = no_ansi_escape_data
 
-        data, no_ansi_escape_data = preprocessor.preprocess(data)
+    def __is_plain_no_ansi_escape_str(self) -> bool:
+        """
+        :return:
+            |True| if the DataProperty of the data without escape sequences would be
+            a string that equals to the data without escape sequences.
+        """
 
-        self.__set_data(data, type_hint, float_type, strict_level_map)
+        value = self.__no_ansi_escape_str
 
-        if no_ansi_escape_data is None or len(data) == len(no_ansi_escape_data):
-            self.__no_ansi_escape_data: Optional[DataProperty] = None
-        else:
-            self.__no_ansi_escape_data = DataProperty(no_ansi_escape_data, float_type=float_type)
+        return (
+            value is not None
+            and "\t" not in value  # tabs are replaced by the default preprocessor
+            and not _has_ansi_escape_char(value)
+            and not _may_be_number(value)
+        )
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, DataProperty):
@@ -157,8 +333,15 @@ class DataProperty(DataPeropertyBase):
     def align(self) -> Align:
         if not self.__align:
             if self.is_include_ansi_escape:
-                assert self.no_ansi_escape_dp
-                self.__align = self.no_ansi_escape_dp.align
+                if self.__no_ansi_escape_dp is None and self.__is_plain_no_ansi_escape_str():
+                    self.__align = align_getter.get_align_from_typecode(
+                        Typecode.STRING
+                        if cast(str, self.__no_ansi_escape_str).strip()
+                        else Typecode.NULL_STRING
+                    )
+                else:
+                    assert self.no_ansi_escape_dp
+                    self.__align = self.no_ansi_escape_dp.align
             else:
                 self.__align = align_getter.get_align_from_typecode(self.typecode)
 
@@ -192,14 +375,32 @@ class DataProperty(DataPeropertyBase):
 
     @property
     def is_include_ansi_escape(self) -> bool:
-        if self.no_ansi_escape_dp is None:
+        if self.__no_ansi_escape_str is None:
             return False
 
+        if (
+            self.__no_ansi_escape_dp is None
+            and self.typecode == Typecode.STRING
+            and "\t" not in self.__no_ansi_escape_str
+        ):
+            # the data without escape sequences is always shorter than the data
+            return True
+
+        assert self.no_ansi_escape_dp
+
         return self.length != self.no_ansi_escape_dp.length
 
     @property
     def no_ansi_escape_dp(self) -> Optional["DataProperty"]:
-        return self.__no_ansi_escape_data
+        if self.__no_ansi_escape_dp is None and self.__no_ansi_escape_str is not None:
+            self.__no_ansi_escape_dp = DataProperty(
+                self.__no_ansi_escape_str,
+                float_type=self.__float_type,
+                east_asian_ambiguous_width=self._east_asian_ambiguous_width,
+                is_grapheme_cluster_aware=self._is_grapheme_cluster_aware,
+            )
+
+        return self.__no_ansi_escape_dp
 
     @property
     def length(self) -> Optional[int]:
@@ -307,15 +508,29 @@ class DataProperty(DataPeropertyBase):
                 return len(str(self.data))
 
         if self.is_include_ansi_escape:
+            if self.__no_ansi_escape_dp is None and self.__is_plain_no_ansi_escape_str():
+                # measure the visible string without creating the DataProperty
+                return calc_ascii_char_width(
+                    cast(str, self.__no_ansi_escape_str),
+                    self._east_asian_ambiguous_width,
+                    self._is_grapheme_cluster_aware,
+                )
+
             assert self.no_ansi_escape_dp
             return self.no_ansi_escape_dp.ascii_char_width
 
-        try:
-            unicode_str = MultiByteStrDecoder(self.data).unicode_str
-        except ValueError:
-            unicode_str = self.to_str()
+        if isinstance(self.data, str):
+            # MultiByteStrDecoder returns str values as they are
+            unicode_str = self.data
+        else:
+            try:
+                unicode_str = MultiByteStrDecoder(self.data).unicode_str
+            except ValueError:
+                unicode_str = self.to_str()
 
-        return calc_ascii_char_width(unicode_str, self._east_asian_ambiguous_width)
+        return calc_ascii_char_width(
+            unicode_str, self._east_asian_ambiguous_width, self._is_grapheme_cluster_aware
+        )
 
     def __set_data(
         self,
@@ -327,9 +542,6 @@ class DataProperty(DataPeropertyBase):
         if float_type is None:
             float_type = DefaultValue.FLOAT_TYPE
 
-        if strict_level_map is None:
-            strict_level_map = DefaultValue.STRICT_LEVEL_MAP
-
         if type_hint:
             type_obj = type_hint(
                 data, strict_level=StrictLevel.MIN, float_type=float_type, strip_ansi_escape=False
@@ -345,18 +557,67 @@ class DataProperty(DataPeropertyBase):
             ).is_type():
                 return
 
-        for type_class in self.__type_class_list:
-            strict_level = strict_level_map.get(
-                type_class(None, 0).typecode, strict_level_map.get("default", StrictLevel.MAX)
-            )
+        type_cascade, str_type_cascade = self.__get_type_cascades(strict_level_map)
 
-            if self.__try_convert_type(data, type_class, strict_level, float_type):
-                return
+        if isinstance(data, str):
+            for type_class, strict_level, preclassifier in str_type_cascade:
+                if preclassifier is not None and not preclassifier(data):
+                    continue
+
+                if self.__try_convert_type(data, type_class, strict_level, float_type):
+                    return
+        else:
+            for type_class, strict_level in type_cascade:
+                if self.__try_convert_type(data, type_class, strict_level, float_type):
+                    return
 
         raise TypeConversionError(
             f"failed to convert: data={data}, strict_level={strict_level_map}"
         )
 
+    @classmethod
+    def _get_type_cascade(cls, strict_level_map: Optional[StrictLevelMap]) -> TypeCascade:
+        """
+        :return:
+            Pairs of a type class and a strict level in the order of type detection.
+            The pairs are built once for each strict level map.
+        """
+
+        type_cascade, _str_type_cascade = cls.__get_type_cascades(strict_level_map)
+
+        return type_cascade
+
+    @classmethod
+    def __get_type_cascades(
+        cls, strict_level_map: Optional[StrictLevelMap]
+    ) -> tuple[TypeCascade, _StrTypeCascade]:
+        if strict_level_map is None:
+            strict_level_map = DefaultValue.STRICT_LEVEL_MAP
+
+        key = frozenset(strict_level_map.items())
+
+        try:
+            return cls.__type_cascade_map[key]
+        except KeyError:
+            pass
+
+        default_strict_level = strict_level_map.get("default", StrictLevel.MAX)
+        type_cascade = tuple(
+            (type_class, strict_level_map.get(typecode, default_strict_level))
+            for type_class, typecode in zip(cls.__type_class_list, cls.__type_class_typecodes)
+        )
+        str_type_cascade = tuple(
+            (type_class, strict_level, _STR_PRECLASSIFIER_MAP.get(type_class))
+            for type_class, strict_level in type_cascade
+            if strict_level < _STR_EXCLUDE_STRICT_LEVEL_MAP.get(type_class, StrictLevel.MAX + 1)
+        )
+
+        if len(cls.__type_cascade_map) >= _MAX_TYPE_CASCADE_CACHE_SIZE:
+            cls.__type_cascade_map.clear()
+        cls.__type_cascade_map[key] = (type_cascade, str_type_cascade)
+
+        return (type_cascade, str_type_cascade)
+
     def __set_digit(self) -> None:
         integer_digits, decimal_places = get_number_of_digit(self.__data)
         self.__integer_digits = integer_digits
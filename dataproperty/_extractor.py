@@ -4,12 +4,21 @@
 
 import copy
 import enum
+import itertools
+import math
+import os
+import random
 import sys
+import threading
+import time
 import typing
-from collections import Counter
-from collections.abc import Sequence
+from collections import Counter, OrderedDict
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from datetime import date, datetime
 from decimal import Decimal
-from typing import Any, Optional, Union, cast
+from types import TracebackType
+from typing import Any, Final, NamedTuple, Optional, Union, cast
 
 import typepy
 from typepy import (
@@ -31,7 +40,8 @@ from typepy import (
 from typepy.type import AbstractType
 
 from ._column import ColumnDataProperty
-from ._common import MIN_STRICT_LEVEL_MAP, DefaultValue
+from ._column_arrays import ColumnArrays
+from ._common import MIN_STRICT_LEVEL_MAP, CacheInfo, DefaultValue
 from ._converter import DataPropertyConverter
 from ._dataproperty import DataProperty
 from ._formatter import Format
@@ -39,6 +49,7 @@ from ._preprocessor import Preprocessor
 from .logger import logger  # type: ignore
 from .typing import (
     DateTimeFormatter,
+    FloatType,
     StrictLevelMap,
     TransFunc,
     TypeHint,
@@ -47,8 +58,60 @@ from .typing import (
 )
 
 
+if typing.TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+
 DataPropertyMatrix = list[list[DataProperty]]
 
+# parameters of the cost model used by the "auto" executor backend
+_AUTO_SAMPLE_CELL_COUNT: Final = 200
+_PROCESS_STARTUP_SEC: Final = 0.1
+_PROCESS_TRANSFER_SEC_PER_CELL: Final = 5e-6
+_TASK_OVERHEAD_SEC: Final = 1e-4
+
+# types of values that can be identified by keys of value caches and dictionary encoding.
+# values of the other types are never cached to avoid identity-based keys.
+_EXACT_VALUE_KEY_TYPES: Final = (str, int, bool, type(None))
+_REPR_VALUE_KEY_TYPES: Final = (float, Decimal, datetime)
+
+# types of values that have the typecodes determined without type detection
+# when trust_python_types is enabled
+_NATIVE_VALUE_TYPES: Final = (bool, int, float, Decimal, date, type(None))
+
+# count of a locked type in a type counter that no other type can exceed
+_LOCKED_TYPE_COUNT: Final = sys.maxsize
+
+# types that are not counted as mismatches with a locked schema
+_NULL_TYPECODES: Final = (Typecode.NONE, Typecode.NULL_STRING)
+
+
+class _ExtractionPlan(NamedTuple):
+    # immutable snapshot of the settings required to convert values to
+    # DataProperty instances in worker processes
+    trans_funcs: tuple[TransFunc, ...]
+    default_type_hint: TypeHint
+    float_type: Optional[FloatType]
+    datetime_format_str: str
+    strict_level_map: tuple[tuple[Union[Typecode, str], int], ...]
+    east_asian_ambiguous_width: int
+    is_grapheme_cluster_aware: bool
+    preprocessor_params: tuple[tuple[str, Any], ...]
+    type_value_map: tuple[tuple[Typecode, Any], ...]
+    quoting_flags: tuple[tuple[Typecode, bool], ...]
+    datetime_formatter: Optional[DateTimeFormatter]
+    dp_cache_size: int
+    low_cardinality_threshold: int
+    trust_python_types: bool
+
+
+@enum.unique
+class ExecutorBackend(enum.Enum):
+    PROCESS = "process"
+    THREAD = "thread"
+    SERIAL = "serial"
+    AUTO = "auto"
+
 
 @enum.unique
 class MatrixFormatting(enum.Enum):
@@ -91,10 +154,102 @@ class DataPropertyExtractor:
                 Typecode.REAL_NUMBER: False,
                 Typecode.STRING: False,
             }
+
+    .. py:attribute:: is_streaming_column_profile
+
+        If |True|, :py:meth:`to_column_dp_list` profiles columns row by row
+        without retaining |DataProperty| instances of each cell.
+        ``value_dp_matrix`` can be any iterable of rows in this mode,
+        such as the return value of :py:meth:`iter_dp_rows`.
+        Defaults to |False|.
+
+    .. py:attribute:: is_grapheme_cluster_aware
+
+        If |True|, widths of strings are calculated for each grapheme cluster
+        rather than for each character:
+        combining characters, variation selectors, and zero width characters have no width,
+        and emoji ZWJ sequences, emoji presentation sequences, and flags are
+        two columns wide.
+        Defaults to |False|.
+
+    .. py:attribute:: executor_backend
+
+        Backend of the worker pool used by :py:meth:`to_dp_matrix`
+        when ``max_workers`` is greater than one.
+        ``"process"`` (process pool), ``"thread"`` (thread pool),
+        ``"serial"`` (always processes in the calling thread),
+        or ``"auto"``.
+        Thread pools are effective on free-threaded Python builds.
+        ``"auto"`` estimates the conversion cost of a matrix from its size and
+        the measured conversion time of sample cells,
+        then selects the fastest one from serial, thread pool, and process pool.
+        ``max_workers`` is the number of CPUs in the ``"auto"`` mode if not specified.
+        Defaults to ``"process"``.
+
+    .. py:attribute:: dp_cache_size
+
+        Maximum number of |DataProperty| instances of the LRU cache that maps
+        values to conversion results.
+        Cells that have the same value and type hint as a cached one
+        skip preprocessing, type detection, and conversion.
+        The cache is cleared when a setting of the extractor is changed.
+        Statistics of the cache are available via :py:meth:`get_dp_cache_info`.
+        ``0`` disables the cache. Defaults to ``0``.
+
+    .. py:attribute:: low_cardinality_threshold
+
+        Maximum number of distinct values of a column to apply dictionary encoding.
+        Each distinct value of a dictionary-encoded column is converted to
+        a |DataProperty| instance only once and the instance is shared by
+        the cells that have the value.
+        :py:class:`~dataproperty.ColumnDataProperty` also aggregates a shared instance once.
+        Columns that have values other than
+        ``str``/``int``/``bool``/``None``/``float``/``Decimal``/``datetime``
+        are not encoded.
+        ``0`` disables dictionary encoding. Defaults to ``0``.
+
+    .. py:attribute:: trust_python_types
+
+        If |True|, typecodes of ``int``/``float``/``decimal.Decimal``/``bool``/
+        ``datetime.datetime``/``datetime.date``/``None`` values are determined by
+        the Python types without the preprocessing and the type detection.
+        Type detection only runs for the other values such as ``str``/``bytes``.
+        Type inference of columns and ``strict_level_map`` do not apply to those values:
+        e.g. ``1.0`` is a real number rather than an integer.
+        ``column_type_hints`` and ``default_type_hint`` still take precedence.
+        Defaults to |False|.
+
+    .. py:attribute:: row_chunk_size
+
+        Number of rows of a task when :py:meth:`to_dp_matrix` is executed in parallel.
+        If |None|, each task processes an entire column.
+        Otherwise, columns are also split into row ranges and processed in parallel.
+        The first chunk of a column determines the type inference state
+        that the rest of the chunks of the column start with.
+        Defaults to |None|.
+
+    .. py:attribute:: locked_type_hints
+
+        Column types locked by :py:meth:`lock_schema`.
+        Cells of a column that has a locked type are validated against the type and
+        fall back to the full type detection only when the validation fails.
+        Unlike ``column_type_hints``, cells are not forcibly converted to the locked types.
+        The number of cells that mismatched the locked types is available via
+        ``schema_mismatch_counts``.
     """
 
     def __init__(self, max_precision: Optional[int] = None) -> None:
-        self.max_workers = DefaultValue.MAX_WORKERS
+        self.__executor: Optional["Executor"] = None
+        self.__owned_executor: Optional["Executor"] = None
+        self.__owned_executor_plan: Optional[_ExtractionPlan] = None
+        self.__owned_executor_backend: Optional[ExecutorBackend] = None
+        self.__executor_backend = ExecutorBackend.PROCESS
+        self.__max_workers: int = DefaultValue.MAX_WORKERS
+        self.__row_chunk_size: Optional[int] = None
+        self.__low_cardinality_threshold = 0
+        self.__trust_python_types = False
+        self.__locked_type_hints: list[TypeHint] = []
+        self.__schema_mismatch_counts: list[int] = []
 
         if max_precision is None:
             self.__max_precision = DefaultValue.MAX_PRECISION
@@ -107,6 +262,7 @@ class DataPropertyExtractor:
 
         self.__strip_str_header: Optional[str] = None
         self.__is_formatting_float = True
+        self.__is_streaming_column_profile = False
         self.__min_col_ascii_char_width = 0
         self.__default_format_flags = Format.NONE
         self.__format_flags_list: Sequence[int] = []
@@ -116,8 +272,11 @@ class DataPropertyExtractor:
             cast(dict[Union[Typecode, str], int], DefaultValue.STRICT_LEVEL_MAP)
         )
         self.__east_asian_ambiguous_width = 1
+        self.__is_grapheme_cluster_aware = False
 
         self.__preprocessor = Preprocessor()
+        self.__cell_preprocessor: Preprocessor
+        self.__header_preprocessor: Preprocessor
 
         self.__type_value_map: TypeValueMap = copy.deepcopy(DefaultValue.TYPE_VALUE_MAP)
 
@@ -127,15 +286,54 @@ class DataPropertyExtractor:
         self.__matrix_formatting = MatrixFormatting.TRIM
         self.__dp_converter: DataPropertyConverter
 
-        self.__clear_cache()
+        self.__dp_cache_size: int = DefaultValue.DP_CACHE_SIZE
+        self.__dp_lru_cache: OrderedDict[tuple, DataProperty] = OrderedDict()
+        self.__dp_cache_lock = threading.Lock()
+        self.__dp_cache_hits = 0
+        self.__dp_cache_misses = 0
+        self.__dp_cache_settings_key: tuple = ()
+        self.__is_cache_stale = True
+        self.__batch_update_depth = 0
+
+        self.__refresh_cache()
 
     def __clear_cache(self) -> None:
+        # caches are rebuilt on the next conversion rather than each time a setting changes
+        self.__is_cache_stale = True
+
+        with self.__dp_cache_lock:
+            self.__dp_lru_cache.clear()
+
+    def __refresh_cache(self) -> None:
+        # settings that may be modified in place without the setters of the extractor
+        settings_key = (
+            self.__preprocessor.strip_str,
+            self.__preprocessor.replace_tabs_with_spaces,
+            self.__preprocessor.tab_length,
+            self.__preprocessor.line_break_handling,
+            self.__preprocessor.line_break_repl,
+            self.__preprocessor.dequote,
+            self.__preprocessor.is_escape_html_tag,
+            self.__preprocessor.is_escape_formula_injection,
+            self.__preprocessor.ansi_escape_handling,
+            tuple(self.__type_value_map.items()),
+            tuple(self.__quoting_flags.items()),
+            tuple(self.__strict_level_map.items()),
+        )
+        if settings_key != self.__dp_cache_settings_key:
+            self.__clear_cache()
+            self.__dp_cache_settings_key = settings_key
+
+        if not self.__is_cache_stale:
+            return
+
         self.__update_dp_converter()
         self.__dp_cache_zero = self.__to_dp_raw(0)
         self.__dp_cache_one = self.__to_dp_raw(1)
         self.__dp_cache_true = self.__to_dp_raw(True)
         self.__dp_cache_false = self.__to_dp_raw(False)
         self.__dp_cache_map = {None: self.__to_dp_raw(None), "": self.__to_dp_raw("")}
+        self.__is_cache_stale = False
 
     @property
     def headers(self) -> Sequence[str]:
@@ -204,6 +402,14 @@ class DataPropertyExtractor:
     def is_formatting_float(self, value: bool) -> None:
         self.__is_formatting_float = value
 
+    @property
+    def is_streaming_column_profile(self) -> bool:
+        return self.__is_streaming_column_profile
+
+    @is_streaming_column_profile.setter
+    def is_streaming_column_profile(self, value: bool) -> None:
+        self.__is_streaming_column_profile = value
+
     @property
     def max_precision(self) -> int:
         return self.__max_precision
@@ -226,7 +432,7 @@ class DataPropertyExtractor:
             return
 
         self.__preprocessor = value
-        self.__update_dp_converter()
+        self.__clear_cache()
 
     @property
     def strip_str_header(self) -> Optional[str]:
@@ -324,6 +530,18 @@ class DataPropertyExtractor:
         self.__east_asian_ambiguous_width = value
         self.__clear_cache()
 
+    @property
+    def is_grapheme_cluster_aware(self) -> bool:
+        return self.__is_grapheme_cluster_aware
+
+    @is_grapheme_cluster_aware.setter
+    def is_grapheme_cluster_aware(self, value: bool) -> None:
+        if self.__is_grapheme_cluster_aware == value:
+            return
+
+        self.__is_grapheme_cluster_aware = value
+        self.__clear_cache()
+
     @property
     def type_value_map(self) -> TypeValueMap:
         return self.__type_value_map
@@ -384,26 +602,229 @@ class DataPropertyExtractor:
     def max_workers(self) -> int:
         assert self.__max_workers
 
+        if self.__executor_backend == ExecutorBackend.PROCESS and not _is_process_pool_available():
+            return 1
+
         return self.__max_workers
 
     @max_workers.setter
     def max_workers(self, value: Optional[int]) -> None:
-        try:
-            from _multiprocessing import SemLock, sem_unlink  # noqa
-        except ImportError:
-            logger.debug("This platform lacks a functioning sem_open implementation")
-            value = 1
+        if not value:
+            value = DefaultValue.MAX_WORKERS
 
-        if "pytest" in sys.modules and value != 1:
-            logger.debug("set max_workers to 1 to avoid deadlock when executed from pytest")
-            value = 1
+        if self.__max_workers != value:
+            self.__shutdown_owned_executor()
 
         self.__max_workers = value
-        if not self.__max_workers:
-            self.__max_workers = DefaultValue.MAX_WORKERS
+
+    @property
+    def executor_backend(self) -> ExecutorBackend:
+        return self.__executor_backend
+
+    @executor_backend.setter
+    def executor_backend(self, value: Union[ExecutorBackend, str]) -> None:
+        if not isinstance(value, ExecutorBackend):
+            try:
+                value = ExecutorBackend(value.lower())
+            except (AttributeError, ValueError):
+                raise ValueError(f"unknown executor backend: {value}")
+
+        if self.__executor_backend == value:
+            return
+
+        self.__shutdown_owned_executor()
+        self.__executor_backend = value
+
+    @property
+    def dp_cache_size(self) -> int:
+        return self.__dp_cache_size
+
+    @dp_cache_size.setter
+    def dp_cache_size(self, value: int) -> None:
+        if value < 0:
+            raise ValueError(f"dp_cache_size must be greater than or equal to zero: actual={value}")
+
+        self.__dp_cache_size = value
+
+        with self.__dp_cache_lock:
+            self.__dp_lru_cache.clear()
+            self.__dp_cache_hits = 0
+            self.__dp_cache_misses = 0
+
+    @property
+    def low_cardinality_threshold(self) -> int:
+        return self.__low_cardinality_threshold
+
+    @low_cardinality_threshold.setter
+    def low_cardinality_threshold(self, value: int) -> None:
+        if value < 0:
+            raise ValueError(
+                f"low_cardinality_threshold must be greater than or equal to zero: actual={value}"
+            )
+
+        self.__low_cardinality_threshold = value
+
+    @property
+    def trust_python_types(self) -> bool:
+        return self.__trust_python_types
+
+    @trust_python_types.setter
+    def trust_python_types(self, value: bool) -> None:
+        if self.__trust_python_types == value:
+            return
+
+        self.__trust_python_types = value
+        self.__clear_cache()
+
+    def get_dp_cache_info(self) -> CacheInfo:
+        """
+        :return: Statistics of the |DataProperty| cache.
+        :rtype: CacheInfo
+        """
+
+        with self.__dp_cache_lock:
+            return CacheInfo(
+                hits=self.__dp_cache_hits,
+                misses=self.__dp_cache_misses,
+                maxsize=self.__dp_cache_size,
+                currsize=len(self.__dp_lru_cache),
+            )
+
+    @property
+    def row_chunk_size(self) -> Optional[int]:
+        return self.__row_chunk_size
+
+    @row_chunk_size.setter
+    def row_chunk_size(self, value: Optional[int]) -> None:
+        if value is not None and value < 1:
+            raise ValueError(f"row_chunk_size must be greater than zero: actual={value}")
+
+        self.__row_chunk_size = value
+
+    @property
+    def locked_type_hints(self) -> list[TypeHint]:
+        return self.__locked_type_hints
+
+    @property
+    def schema_mismatch_counts(self) -> list[int]:
+        return self.__schema_mismatch_counts
+
+    def lock_schema(
+        self,
+        value_matrix: Sequence[Sequence[Any]],
+        sample_size: int = DefaultValue.SCHEMA_SAMPLE_SIZE,
+        is_random_sample: bool = False,
+    ) -> list[TypeHint]:
+        """
+        Infer types of columns from sample rows of a data matrix and lock the types.
+        The locked types are kept until :py:meth:`unlock_schema` is called,
+        then they apply to the rest of the rows of the data matrix, or to
+        the rest of the chunks of a streaming job.
+        Columns that have ``column_type_hints``,
+        or that only have ``None``/empty string sample values are not locked.
+
+        :param value_matrix: Data matrix to sample rows from.
+        :param sample_size: Number of sample rows.
+        :param is_random_sample:
+            If |True|, sample rows at random. Otherwise, use the first ``sample_size`` rows.
+        :return: Locked types for each column.
+        :raises ValueError: If the ``sample_size`` is less than ``1``.
+        """
+
+        if sample_size < 1:
+            raise ValueError(f"sample_size must be greater than zero: actual={sample_size}")
+
+        self.unlock_schema()
+
+        if is_random_sample and len(value_matrix) > sample_size:
+            sample_matrix = [
+                value_matrix[row_idx]
+                for row_idx in sorted(random.sample(range(len(value_matrix)), sample_size))
+            ]
+        else:
+            sample_matrix = list(itertools.islice(value_matrix, sample_size))
+
+        sample_dp_matrix: Sequence[Sequence[Any]]
+        if self.__is_dp_matrix(sample_matrix):
+            sample_dp_matrix = sample_matrix
+        else:
+            self.__refresh_cache()
+            sample_dp_matrix = self.__to_dp_matrix_st(self.__strip_data_matrix(sample_matrix))
+
+        locked_type_hints: list[TypeHint] = []
+        for col_idx, value_dp_list in enumerate(zip(*sample_dp_matrix)):
+            type_counter = Counter(
+                value_dp.type_class
+                for value_dp in value_dp_list
+                if value_dp.typecode not in _NULL_TYPECODES
+            )
+
+            if self.__get_col_type_hint(col_idx) is not None:
+                locked_type_hints.append(None)
+            else:
+                locked_type_hints.append(self.__get_most_common_type(type_counter))
+
+        logger.debug(f"lock schema: sample_rows={len(sample_matrix)}, types={locked_type_hints}")
+
+        self.__locked_type_hints = locked_type_hints
+        self.__schema_mismatch_counts = [0] * len(locked_type_hints)
+
+        return locked_type_hints
+
+    def unlock_schema(self) -> None:
+        """
+        Unlock the column types locked by :py:meth:`lock_schema` and
+        reset ``schema_mismatch_counts``.
+        """
+
+        self.__locked_type_hints = []
+        self.__schema_mismatch_counts = []
+
+    @property
+    def executor(self) -> Optional["Executor"]:
+        return self.__executor
+
+    @executor.setter
+    def executor(self, value: Optional["Executor"]) -> None:
+        self.__executor = value
+
+    def close(self) -> None:
+        """
+        Shut down the worker pool owned by the extractor.
+        An executor injected via the ``executor`` property is not shut down.
+        """
+
+        self.__shutdown_owned_executor()
+
+    def __enter__(self) -> "DataPropertyExtractor":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+
+        # executors are not picklable and not needed in worker processes
+        state["_DataPropertyExtractor__executor"] = None
+        state["_DataPropertyExtractor__owned_executor"] = None
+        state["_DataPropertyExtractor__owned_executor_plan"] = None
+        state["_DataPropertyExtractor__owned_executor_backend"] = None
+        del state["_DataPropertyExtractor__dp_cache_lock"]
+
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.__dp_cache_lock = threading.Lock()
 
     def to_dp(self, value: Any) -> DataProperty:
-        self.__update_dp_converter()
+        self.__refresh_cache()
 
         return self.__to_dp(value)
 
@@ -411,7 +832,7 @@ class DataPropertyExtractor:
         if is_empty_sequence(values):
             return []
 
-        self.__update_dp_converter()
+        self.__refresh_cache()
 
         return self._to_dp_list(values)
 
@@ -453,30 +874,13 @@ class DataPropertyExtractor:
             logger.debug(log)
 
         logger.debug("  results:")
-        for col_idx, value_dp_list in enumerate(zip(*value_dp_matrix)):
-            try:
-                col_dp_list[col_idx]
-            except IndexError:
-                col_dp_list.append(
-                    ColumnDataProperty(
-                        column_index=col_idx,
-                        float_type=self.float_type,
-                        min_width=self.min_column_width,
-                        format_flags=self.__get_format_flags(col_idx),
-                        is_formatting_float=self.is_formatting_float,
-                        datetime_format_str=self.datetime_format_str,
-                        east_asian_ambiguous_width=self.east_asian_ambiguous_width,
-                        max_precision=self.__max_precision,
-                    )
-                )
 
-            col_dp = col_dp_list[col_idx]
-            col_dp.begin_update()
+        if self.is_streaming_column_profile:
+            self.__update_col_dp_list_by_rows(col_dp_list, value_dp_matrix, previous_column_dp_list)
+            return col_dp_list
 
-            try:
-                col_dp.merge(previous_column_dp_list[col_idx])  # type: ignore
-            except (TypeError, IndexError):
-                pass
+        for col_idx, value_dp_list in enumerate(zip(*value_dp_matrix)):
+            col_dp = self.__begin_col_dp_update(col_dp_list, col_idx, previous_column_dp_list)
 
             for value_dp in value_dp_list:
                 col_dp.update_body(value_dp)
@@ -488,7 +892,7 @@ class DataPropertyExtractor:
         return col_dp_list
 
     def to_dp_matrix(self, value_matrix: Sequence[Sequence[Any]]) -> DataPropertyMatrix:
-        self.__update_dp_converter()
+        self.__refresh_cache()
         logger.debug(f"max_workers={self.max_workers}, preprocessor={self.__preprocessor}")
 
         value_matrix = self.__strip_data_matrix(value_matrix)
@@ -497,27 +901,179 @@ class DataPropertyExtractor:
             logger.debug("already a dataproperty matrix")
             return value_matrix  # type: ignore
 
-        if self.max_workers <= 1:
-            return self.__to_dp_matrix_st(value_matrix)
+        backend = self.__resolve_executor_backend(value_matrix)
+        if backend == ExecutorBackend.SERIAL:
+            value_dp_matrix = self.__to_dp_matrix_st(value_matrix)
+        else:
+            value_dp_matrix = self.__to_dp_matrix_mt(value_matrix, backend)
 
-        return self.__to_dp_matrix_mt(value_matrix)
+        if self.__locked_type_hints:
+            for col_idx, value_dp_list in enumerate(zip(*value_dp_matrix)):
+                self.__count_schema_mismatches(
+                    col_idx, (value_dp.typecode for value_dp in value_dp_list)
+                )
 
-    def to_header_dp_list(self) -> list[DataProperty]:
-        self.__update_dp_converter()
+        return value_dp_matrix
+
+    def iter_dp_rows(
+        self, value_rows: Iterable[Sequence[Any]], chunk_size: int = DefaultValue.CHUNK_SIZE
+    ) -> Iterator[list[DataProperty]]:
+        """
+        Convert rows to |DataProperty| rows chunk by chunk.
+        Only ``chunk_size`` rows are held in memory at once,
+        while the type inference state of each column is carried across the chunks.
+
+        The number of columns is fixed by the headers and the first chunk
+        according to the ``matrix_formatting``.
+
+        :param value_rows: Iterable of rows. Rows are consumed lazily.
+        :param chunk_size: Number of rows to convert at once.
+        :return: Iterator that yields a |DataProperty| list for each row.
+        :raises ValueError:
+            If the ``chunk_size`` is less than ``1``.
+            Or column sizes are nonuniform when the ``matrix_formatting`` is
+            ``MatrixFormatting.EXCEPTION``.
+        """
+
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be greater than zero: actual={chunk_size}")
+
+        self.__refresh_cache()
+        logger.debug(f"chunk_size={chunk_size}, preprocessor={self.__preprocessor}")
+
+        row_iter = iter(value_rows)
+        format_col_size: Optional[int] = None
+        type_counters: list[typing.Counter[type[AbstractType]]] = []
+
+        while True:
+            chunk = list(itertools.islice(row_iter, chunk_size))
+            if not chunk:
+                return
+
+            col_size_list = [len(row) for row in chunk]
+            if format_col_size is None:
+                format_col_size = self.__get_format_col_size(col_size_list)
+                type_counters = [
+                    self.__create_type_counter(col_idx) for col_idx in range(format_col_size)
+                ]
+            elif self.matrix_formatting == MatrixFormatting.EXCEPTION:
+                self.__get_format_col_size([format_col_size] + col_size_list)
+
+            row_list = self.__format_data_matrix(chunk, col_size_list, format_col_size)
+
+            if self.__is_dp_matrix(row_list):
+                yield from row_list
+                continue
+
+            dp_columns = [
+                self._to_dp_list(
+                    values,
+                    type_hint=self.__get_col_type_hint(col_idx),
+                    preprocessor=self.__preprocessor,
+                    type_counter=type_counters[col_idx],
+                )
+                for col_idx, values in enumerate(zip(*row_list))
+            ]
+
+            for col_idx, value_dp_list in enumerate(dp_columns):
+                self.__count_schema_mismatches(
+                    col_idx, (value_dp.typecode for value_dp in value_dp_list)
+                )
+
+            for dp_row in zip(*dp_columns):
+                yield list(dp_row)
+
+    def to_column_arrays(self, value_matrix: Sequence[Sequence[Any]]) -> list[ColumnArrays]:
+        """
+        Convert a data matrix to column-oriented compact arrays.
+        Unlike :py:meth:`to_dp_matrix`, |DataProperty| instances for each cell are not retained.
 
-        preprocessor = copy.deepcopy(self.__preprocessor)
-        preprocessor.strip_str = self.strip_str_header
+        :return: List of |ColumnArrays| for each column.
+        """
+
+        self.__refresh_cache()
+        logger.debug(f"preprocessor={self.__preprocessor}")
+
+        value_matrix = self.__strip_data_matrix(value_matrix)
+
+        if self.__is_dp_matrix(value_matrix):
+            logger.debug("already a dataproperty matrix")
+            return [
+                self.__to_column_arrays(col_idx, value_dp_list)
+                for col_idx, value_dp_list in enumerate(zip(*value_matrix))
+            ]
+
+        col_arrays_list = [
+            self.__to_column_arrays(
+                col_idx,
+                self._iter_dp(
+                    values,
+                    type_hint=self.__get_col_type_hint(col_idx),
+                    preprocessor=self.__preprocessor,
+                    type_counter=self.__create_type_counter(col_idx),
+                ),
+            )
+            for col_idx, values in enumerate(zip(*value_matrix))
+        ]
+
+        for col_arrays in col_arrays_list:
+            self.__count_schema_mismatches(
+                col_arrays.column_index,
+                (Typecode(typecode) for typecode in col_arrays.typecodes),
+            )
+
+        return col_arrays_list
+
+    def to_header_dp_list(self) -> list[DataProperty]:
+        self.__refresh_cache()
 
         return self._to_dp_list(
             self.headers,
             type_hint=String,
-            preprocessor=preprocessor,
+            preprocessor=self.__header_preprocessor,
             strict_level_map=MIN_STRICT_LEVEL_MAP,
         )
 
+    @contextmanager
+    def batch_update(self) -> Iterator["DataPropertyExtractor"]:
+        """
+        Context manager to change multiple settings of the extractor at once.
+        Caches of the extractor are rebuilt only once when exiting the outermost context,
+        instead of being rebuilt for each setting.
+        """
+
+        self.__batch_update_depth += 1
+        try:
+            yield self
+        finally:
+            self.__batch_update_depth -= 1
+
+        if self.__batch_update_depth == 0 and self.__is_cache_stale:
+            self.__refresh_cache()
+
+    def configure(self, **settings: Any) -> None:
+        """
+        Change multiple settings of the extractor at once.
+        Caches of the extractor are rebuilt only once for all of the settings.
+
+        :param settings: Pairs of a property name and a value,
+            e.g. ``configure(float_type=Decimal, max_precision=3)``.
+        :raises ValueError: If a setting is not a settable property of the extractor.
+        """
+
+        for name in settings:
+            attr = getattr(type(self), name, None)
+            if not isinstance(attr, property) or attr.fset is None:
+                raise ValueError(f"unknown setting: {name}")
+
+        with self.batch_update():
+            for name, value in settings.items():
+                setattr(self, name, value)
+
     def update_preprocessor(self, **kwargs: Any) -> bool:
         is_updated = self.__preprocessor.update(**kwargs)
-        self.__update_dp_converter()
+        if is_updated:
+            self.__clear_cache()
 
         return is_updated
 
@@ -579,6 +1135,46 @@ class DataPropertyExtractor:
         for trans_func in self.__trans_func_list:
             data = trans_func(data)
 
+        if self.__dp_cache_size <= 0 or strict_level_map is not None:
+            return self.__to_dp_uncached(data, type_hint, preprocessor, strict_level_map)
+
+        if preprocessor is not None and preprocessor is not self.__preprocessor:
+            return self.__to_dp_uncached(data, type_hint, preprocessor, strict_level_map)
+
+        value_key = _to_value_key(data)
+        if value_key is None:
+            return self.__to_dp_uncached(data, type_hint, preprocessor, strict_level_map)
+
+        cache_key = (value_key, type_hint)
+
+        with self.__dp_cache_lock:
+            value_dp = self.__dp_lru_cache.get(cache_key)
+
+            if value_dp is not None:
+                self.__dp_lru_cache.move_to_end(cache_key)
+                self.__dp_cache_hits += 1
+
+                return value_dp
+
+            self.__dp_cache_misses += 1
+
+        value_dp = self.__to_dp_uncached(data, type_hint, preprocessor, strict_level_map)
+
+        with self.__dp_cache_lock:
+            self.__dp_lru_cache[cache_key] = value_dp
+
+            if len(self.__dp_lru_cache) > self.__dp_cache_size:
+                self.__dp_lru_cache.popitem(last=False)
+
+        return value_dp
+
+    def __to_dp_uncached(
+        self,
+        data: Any,
+        type_hint: TypeHint,
+        preprocessor: Optional[Preprocessor],
+        strict_level_map: Optional[StrictLevelMap],
+    ) -> DataProperty:
         if type_hint:
             return self.__to_dp_raw(
                 data,
@@ -594,6 +1190,11 @@ class DataPropertyExtractor:
             # unhashable type
             pass
 
+        if self.__is_trusted_type(data):
+            native_dp = self.__to_native_dp(data)
+            if native_dp is not None:
+                return native_dp
+
         if data == 0:
             if data is False:
                 return self.__dp_cache_false
@@ -607,6 +1208,56 @@ class DataPropertyExtractor:
             data, type_hint=type_hint, preprocessor=preprocessor, strict_level_map=strict_level_map
         )
 
+    def __is_trusted_type(self, data: Any) -> bool:
+        return self.__trust_python_types and isinstance(data, _NATIVE_VALUE_TYPES)
+
+    def __to_native_dp(self, data: Any) -> Optional[DataProperty]:
+        if self.default_type_hint is not None:
+            return None
+
+        typecode: Typecode
+        if data is None:
+            typecode = Typecode.NONE
+        elif isinstance(data, bool):
+            typecode = Typecode.BOOL
+        elif isinstance(data, int):
+            typecode = Typecode.INTEGER
+            data = int(data)
+        elif isinstance(data, (float, Decimal)):
+            if isinstance(data, Decimal):
+                is_nan, is_inf = data.is_nan(), data.is_infinite()
+            else:
+                is_nan, is_inf = math.isnan(data), math.isinf(data)
+
+            if is_nan:
+                typecode = Typecode.NAN
+            elif is_inf:
+                typecode = Typecode.INFINITY
+            else:
+                typecode = Typecode.REAL_NUMBER
+
+            float_type = self.float_type if self.float_type else DefaultValue.FLOAT_TYPE
+            if not isinstance(data, float_type):
+                data = float_type(str(data)) if isinstance(data, float) else float_type(data)
+        elif isinstance(data, datetime):
+            typecode = Typecode.DATETIME
+        elif isinstance(data, date):
+            typecode = Typecode.DATETIME
+            data = datetime(year=data.year, month=data.month, day=data.day)
+        else:
+            return None
+
+        value_dp = DataProperty._from_typed_data(
+            data,
+            typecode,
+            float_type=self.float_type,
+            datetime_format_str=self.datetime_format_str,
+            east_asian_ambiguous_width=self.east_asian_ambiguous_width,
+            is_grapheme_cluster_aware=self.is_grapheme_cluster_aware,
+        )
+
+        return self.__dp_converter.convert(value_dp)
+
     def __to_dp_raw(
         self,
         data: Any,
@@ -614,22 +1265,10 @@ class DataPropertyExtractor:
         preprocessor: Optional[Preprocessor] = None,
         strict_level_map: Optional[StrictLevelMap] = None,
     ) -> DataProperty:
-        if preprocessor:
-            preprocessor = Preprocessor(
-                dequote=preprocessor.dequote,
-                line_break_handling=preprocessor.line_break_handling,
-                line_break_repl=preprocessor.line_break_repl,
-                strip_str=preprocessor.strip_str,
-                is_escape_formula_injection=preprocessor.is_escape_formula_injection,
-            )
-        else:
-            preprocessor = Preprocessor(
-                dequote=self.preprocessor.dequote,
-                line_break_handling=self.preprocessor.line_break_handling,
-                line_break_repl=self.preprocessor.line_break_repl,
-                strip_str=self.preprocessor.strip_str,
-                is_escape_formula_injection=self.__preprocessor.is_escape_formula_injection,
-            )
+        if preprocessor is None or preprocessor is self.__preprocessor:
+            preprocessor = self.__cell_preprocessor
+        elif preprocessor is not self.__header_preprocessor:
+            preprocessor = self.__to_cell_preprocessor(preprocessor, preprocessor.strip_str)
 
         value_dp = DataProperty(
             data,
@@ -639,6 +1278,7 @@ class DataPropertyExtractor:
             datetime_format_str=self.datetime_format_str,
             strict_level_map=(strict_level_map if type_hint is not None else self.strict_level_map),
             east_asian_ambiguous_width=self.east_asian_ambiguous_width,
+            is_grapheme_cluster_aware=self.is_grapheme_cluster_aware,
         )
 
         return self.__dp_converter.convert(value_dp)
@@ -653,54 +1293,488 @@ class DataPropertyExtractor:
                         values,
                         self.__get_col_type_hint(col_idx),
                         self.__preprocessor,
+                        self.__create_type_counter(col_idx),
                     )[1]
                     for col_idx, values in enumerate(zip(*value_matrix))
                 )
             )
         )
 
-    def __to_dp_matrix_mt(self, value_matrix: Sequence[Sequence[Any]]) -> DataPropertyMatrix:
+    def __to_dp_matrix_mt(
+        self, value_matrix: Sequence[Sequence[Any]], backend: ExecutorBackend
+    ) -> DataPropertyMatrix:
         from concurrent import futures
 
+        executor = self.__get_executor(backend)
+        task_context: Union[_ExtractionPlan, DataPropertyExtractor, None]
+
+        if isinstance(executor, futures.ThreadPoolExecutor):
+            # threads share the extractor: conversions only read the state of the extractor
+            task_context = self
+        elif executor is self.__owned_executor:
+            # the plan is sent once per worker via the pool initializer
+            task_context = None
+        else:
+            # an injected executor has no initializer, then send the plan with each task
+            task_context = self.__create_plan()
+
+        if self.row_chunk_size is not None:
+            return self.__to_dp_matrix_mt_row_chunk(
+                executor, task_context, value_matrix, self.row_chunk_size
+            )
+
         col_data_map = {}
+        future_list = [
+            executor.submit(
+                _to_column_arrays_chunk_helper,
+                task_context,
+                col_idx,
+                values,
+                self.__get_col_type_hint(col_idx),
+                self.__create_type_counter(col_idx),
+            )
+            for col_idx, values in enumerate(zip(*value_matrix))
+        ]
 
-        with futures.ProcessPoolExecutor(self.max_workers) as executor:
-            future_list = [
-                executor.submit(
-                    _to_dp_list_helper,
-                    self,
-                    col_idx,
-                    values,
-                    self.__get_col_type_hint(col_idx),
-                    self.__preprocessor,
+        for future in futures.as_completed(future_list):
+            col_arrays, _type_counter = future.result()
+            col_data_map[col_arrays.column_index] = col_arrays.to_dp_list()
+
+        return list(
+            zip(*(col_data_map[col_idx] for col_idx in sorted(col_data_map)))  # type: ignore
+        )
+
+    def __to_dp_matrix_mt_row_chunk(
+        self,
+        executor: "Executor",
+        task_context: Union[_ExtractionPlan, "DataPropertyExtractor", None],
+        value_matrix: Sequence[Sequence[Any]],
+        row_chunk_size: int,
+    ) -> DataPropertyMatrix:
+        col_values_list = list(zip(*value_matrix))
+        logger.debug(
+            "split columns into row chunks: cols={}, rows={}, row_chunk_size={}".format(
+                len(col_values_list), len(value_matrix), row_chunk_size
+            )
+        )
+
+        head_future_list = [
+            executor.submit(
+                _to_column_arrays_chunk_helper,
+                task_context,
+                col_idx,
+                values[:row_chunk_size],
+                self.__get_col_type_hint(col_idx),
+                self.__create_type_counter(col_idx),
+            )
+            for col_idx, values in enumerate(col_values_list)
+        ]
+
+        # the rest of the chunks of a column start with the type inference state
+        # at the end of the first chunk of the column
+        col_chunk_lists = []
+        for col_idx, (values, head_future) in enumerate(zip(col_values_list, head_future_list)):
+            _col_arrays, head_type_counter = head_future.result()
+            col_chunk_lists.append(
+                [(values[:row_chunk_size], self.__create_type_counter(col_idx), head_future)]
+                + [
+                    (
+                        values[row_idx : row_idx + row_chunk_size],
+                        head_type_counter,
+                        executor.submit(
+                            _to_column_arrays_chunk_helper,
+                            task_context,
+                            col_idx,
+                            values[row_idx : row_idx + row_chunk_size],
+                            self.__get_col_type_hint(col_idx),
+                            head_type_counter,
+                        ),
+                    )
+                    for row_idx in range(row_chunk_size, len(values), row_chunk_size)
+                ]
+            )
+
+        return list(
+            zip(  # type: ignore
+                *(
+                    self.__merge_row_chunks(
+                        self.__get_col_type_hint(col_idx),
+                        [
+                            (values, type_counter) + future.result()
+                            for values, type_counter, future in col_chunk_list
+                        ],
+                    )
+                    for col_idx, col_chunk_list in enumerate(col_chunk_lists)
                 )
-                for col_idx, values in enumerate(zip(*value_matrix))
+            )
+        )
+
+    def __merge_row_chunks(
+        self,
+        type_hint: TypeHint,
+        chunk_list: Sequence[
+            tuple[
+                Sequence[Any],
+                Optional[typing.Counter[type[AbstractType]]],
+                ColumnArrays,
+                typing.Counter[type[AbstractType]],
             ]
+        ],
+    ) -> list[DataProperty]:
+        if type_hint is not None:
+            return list(
+                itertools.chain.from_iterable(
+                    col_arrays.iter_dp() for _values, _type_counter, col_arrays, _ in chunk_list
+                )
+            )
 
-            for future in futures.as_completed(future_list):
-                col_idx, value_dp_list = future.result()
-                col_data_map[col_idx] = value_dp_list
+        # replay the type inference state of each chunk along with the state of
+        # serial processing. rows after the states diverged are converted again to
+        # make the results identical to serial processing.
+        merged_value_dp_list: list[DataProperty] = []
+        type_counter: typing.Counter[type[AbstractType]] = Counter(chunk_list[0][1])
 
-        return list(
-            zip(*(col_data_map[col_idx] for col_idx in sorted(col_data_map)))  # type: ignore
+        for values, chunk_type_counter, col_arrays, end_type_counter in chunk_list:
+            chunk_type_counter = Counter(chunk_type_counter)
+            increment_counter = end_type_counter - chunk_type_counter
+
+            if list(chunk_type_counter.items()) == list(type_counter.items()) or (
+                self.__get_stable_most_common_type(chunk_type_counter, increment_counter)
+                is self.__get_stable_most_common_type(type_counter, increment_counter)
+                is not None
+            ):
+                merged_value_dp_list.extend(col_arrays.iter_dp())
+                type_counter.update(increment_counter)
+                continue
+
+            for row_idx, value_dp in enumerate(col_arrays.iter_dp()):
+                if self.__get_most_common_type(chunk_type_counter) != self.__get_most_common_type(
+                    type_counter
+                ):
+                    logger.debug(f"reconvert a row chunk from the row {row_idx}")
+                    merged_value_dp_list.extend(
+                        self._iter_dp(values[row_idx:], type_counter=type_counter)
+                    )
+                    break
+
+                chunk_type_counter[value_dp.type_class] += 1
+                type_counter[value_dp.type_class] += 1
+                merged_value_dp_list.append(value_dp)
+
+        return merged_value_dp_list
+
+    @classmethod
+    def __get_stable_most_common_type(
+        cls,
+        type_counter: typing.Counter[type[AbstractType]],
+        increment_counter: typing.Counter[type[AbstractType]],
+    ) -> Optional[type[AbstractType]]:
+        # return the most common type of the type_counter if the type never changes
+        # while adding counts of the increment_counter in any order
+        most_common_type = cls.__get_most_common_type(type_counter)
+        if most_common_type is None:
+            return None
+
+        for type_class, count in increment_counter.items():
+            if type_class is most_common_type:
+                continue
+
+            if type_counter[type_class] + count >= type_counter[most_common_type]:
+                return None
+
+        return most_common_type
+
+    @staticmethod
+    def __get_most_common_type(
+        type_counter: typing.Counter[type[AbstractType]],
+    ) -> Optional[type[AbstractType]]:
+        for type_class, _count in type_counter.most_common(1):
+            return type_class
+
+        return None
+
+    def __create_type_counter(self, col_idx: int) -> typing.Counter[type[AbstractType]]:
+        # the count of a locked type keeps the type the most common type of a column.
+        # then cells are validated against the locked type, and
+        # only cells that failed the validation go through the full type detection.
+        try:
+            locked_type_hint = self.__locked_type_hints[col_idx]
+        except IndexError:
+            locked_type_hint = None
+
+        if locked_type_hint is None:
+            return Counter()
+
+        return Counter({locked_type_hint: _LOCKED_TYPE_COUNT})
+
+    def __count_schema_mismatches(self, col_idx: int, typecodes: Iterable[Typecode]) -> None:
+        try:
+            locked_type_hint = self.__locked_type_hints[col_idx]
+        except IndexError:
+            return
+
+        if locked_type_hint is None:
+            return
+
+        locked_typecode = locked_type_hint(None, StrictLevel.MIN).typecode
+        mismatch_count = sum(
+            1
+            for typecode in typecodes
+            if typecode != locked_typecode and typecode not in _NULL_TYPECODES
+        )
+        if mismatch_count == 0:
+            return
+
+        logger.debug(
+            f"schema mismatch: column={col_idx}, type={locked_type_hint.__name__}, "
+            f"count={mismatch_count}"
+        )
+        self.__schema_mismatch_counts[col_idx] += mismatch_count
+
+    def __get_worker_count(self) -> int:
+        if self.executor_backend == ExecutorBackend.AUTO and self.max_workers <= 1:
+            return os.cpu_count() or 1
+
+        return self.max_workers
+
+    def __resolve_executor_backend(self, value_matrix: Sequence[Sequence[Any]]) -> ExecutorBackend:
+        if self.executor_backend == ExecutorBackend.AUTO:
+            return self.__estimate_executor_backend(value_matrix)
+
+        if self.executor_backend == ExecutorBackend.SERIAL or (
+            self.__executor is None and self.max_workers <= 1
+        ):
+            return ExecutorBackend.SERIAL
+
+        return self.executor_backend
+
+    def __estimate_executor_backend(self, value_matrix: Sequence[Sequence[Any]]) -> ExecutorBackend:
+        from concurrent import futures
+
+        row_count = len(value_matrix)
+        col_count = max((len(values) for values in value_matrix[:1]), default=0)
+        cell_count = row_count * col_count
+        worker_count = self.__get_worker_count()
+
+        if cell_count <= _AUTO_SAMPLE_CELL_COUNT or (self.__executor is None and worker_count <= 1):
+            logger.debug(f"auto executor backend: serial (cells={cell_count})")
+            return ExecutorBackend.SERIAL
+
+        # measure the conversion time per cell with the leading rows of the matrix
+        sample_matrix = value_matrix[: max(_AUTO_SAMPLE_CELL_COUNT // col_count, 1)]
+        start_time = time.perf_counter()
+        self.__to_dp_matrix_st(sample_matrix)
+        sec_per_cell = (time.perf_counter() - start_time) / (len(sample_matrix) * col_count)
+
+        serial_cost = sec_per_cell * cell_count
+        parallelism = min(worker_count, os.cpu_count() or 1)
+        if self.row_chunk_size is None:
+            parallelism = min(parallelism, col_count)
+            task_count = col_count
+        else:
+            task_count = col_count * -(-row_count // self.row_chunk_size)
+        parallel_cost = serial_cost / parallelism + task_count * _TASK_OVERHEAD_SEC
+
+        is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+        cost_map = {ExecutorBackend.SERIAL: serial_cost}
+
+        if self.__executor is not None:
+            if isinstance(self.__executor, futures.ThreadPoolExecutor):
+                backend = ExecutorBackend.THREAD
+            else:
+                backend = ExecutorBackend.PROCESS
+            cost_map[backend] = serial_cost if is_gil_enabled else parallel_cost
+        else:
+            if not is_gil_enabled:
+                cost_map[ExecutorBackend.THREAD] = parallel_cost
+            if _is_process_pool_available():
+                cost_map[ExecutorBackend.PROCESS] = (
+                    parallel_cost
+                    + cell_count * _PROCESS_TRANSFER_SEC_PER_CELL
+                    + (
+                        0
+                        if self.__owned_executor_backend == ExecutorBackend.PROCESS
+                        else _PROCESS_STARTUP_SEC
+                    )
+                )
+
+        backend = min(cost_map, key=lambda key: cost_map[key])
+        logger.debug(
+            "auto executor backend: {} (cells={}, workers={}, sec_per_cell={:.2e}, "
+            "estimated_costs={})".format(
+                backend.value,
+                cell_count,
+                worker_count,
+                sec_per_cell,
+                {key.value: f"{cost:.4f}" for key, cost in cost_map.items()},
+            )
         )
 
+        return backend
+
+    def __get_executor(self, backend: ExecutorBackend) -> "Executor":
+        if self.__executor is not None:
+            return self.__executor
+
+        from concurrent import futures
+
+        if self.__owned_executor is not None and self.__owned_executor_backend != backend:
+            self.__shutdown_owned_executor()
+
+        worker_count = self.__get_worker_count()
+
+        if backend == ExecutorBackend.THREAD:
+            if self.__owned_executor is None:
+                logger.debug(f"create a thread pool: max_workers={worker_count}")
+                self.__owned_executor = futures.ThreadPoolExecutor(worker_count)
+                self.__owned_executor_backend = backend
+
+            return self.__owned_executor
+
+        plan = self.__create_plan()
+
+        if self.__owned_executor is not None and self.__owned_executor_plan != plan:
+            logger.debug("extraction plan changed")
+            self.__shutdown_owned_executor()
+
+        if self.__owned_executor is None:
+            logger.debug(f"create a process pool: max_workers={worker_count}")
+            self.__owned_executor = futures.ProcessPoolExecutor(
+                worker_count, initializer=_init_worker, initargs=(plan,)
+            )
+            self.__owned_executor_plan = plan
+            self.__owned_executor_backend = backend
+
+        return self.__owned_executor
+
+    def __shutdown_owned_executor(self) -> None:
+        if self.__owned_executor is None:
+            return
+
+        logger.debug("shutdown the worker pool")
+        self.__owned_executor.shutdown()
+        self.__owned_executor = None
+        self.__owned_executor_plan = None
+        self.__owned_executor_backend = None
+
+    def __create_plan(self) -> _ExtractionPlan:
+        preprocessor = self.__preprocessor
+
+        return _ExtractionPlan(
+            trans_funcs=tuple(self.__trans_func_list),
+            default_type_hint=self.default_type_hint,
+            float_type=self.float_type,
+            datetime_format_str=self.datetime_format_str,
+            strict_level_map=tuple(self.strict_level_map.items()),
+            east_asian_ambiguous_width=self.east_asian_ambiguous_width,
+            is_grapheme_cluster_aware=self.is_grapheme_cluster_aware,
+            preprocessor_params=(
+                ("strip_str", preprocessor.strip_str),
+                ("replace_tabs_with_spaces", preprocessor.replace_tabs_with_spaces),
+                ("tab_length", preprocessor.tab_length),
+                ("line_break_handling", preprocessor.line_break_handling),
+                ("line_break_repl", preprocessor.line_break_repl),
+                ("dequote", preprocessor.dequote),
+                ("is_escape_html_tag", preprocessor.is_escape_html_tag),
+                ("is_escape_formula_injection", preprocessor.is_escape_formula_injection),
+                ("ansi_escape_handling", preprocessor.ansi_escape_handling),
+            ),
+            type_value_map=tuple(self.type_value_map.items()),
+            quoting_flags=tuple(self.quoting_flags.items()),
+            datetime_formatter=self.datetime_formatter,
+            dp_cache_size=self.dp_cache_size,
+            low_cardinality_threshold=self.low_cardinality_threshold,
+            trust_python_types=self.trust_python_types,
+        )
+
+    @classmethod
+    def _from_plan(cls, plan: _ExtractionPlan) -> "DataPropertyExtractor":
+        extractor = cls()
+        extractor.__trans_func_list = list(plan.trans_funcs)
+        extractor.__default_type_hint = plan.default_type_hint
+        extractor.__float_type = plan.float_type
+        extractor.__datetime_format_str = plan.datetime_format_str
+        extractor.__strict_level_map = dict(plan.strict_level_map)
+        extractor.__east_asian_ambiguous_width = plan.east_asian_ambiguous_width
+        extractor.__is_grapheme_cluster_aware = plan.is_grapheme_cluster_aware
+        extractor.__preprocessor = Preprocessor(**dict(plan.preprocessor_params))
+        extractor.__type_value_map = dict(plan.type_value_map)
+        extractor.__quoting_flags = dict(plan.quoting_flags)
+        extractor.__datetime_formatter = plan.datetime_formatter
+        extractor.__dp_cache_size = plan.dp_cache_size
+        extractor.__low_cardinality_threshold = plan.low_cardinality_threshold
+        extractor.__trust_python_types = plan.trust_python_types
+
+        # caches of the new instance were built with the default settings
+        extractor.__clear_cache()
+        extractor.__refresh_cache()
+
+        return extractor
+
+    def __to_column_arrays(self, col_idx: int, value_dps: Iterable[DataProperty]) -> ColumnArrays:
+        col_arrays = ColumnArrays(
+            column_index=col_idx,
+            float_type=self.float_type,
+            datetime_format_str=self.datetime_format_str,
+            east_asian_ambiguous_width=self.east_asian_ambiguous_width,
+            is_grapheme_cluster_aware=self.is_grapheme_cluster_aware,
+            ansi_escape_handling=self.__preprocessor.ansi_escape_handling,
+        )
+
+        for value_dp in value_dps:
+            col_arrays.append(value_dp)
+
+        return col_arrays
+
     def _to_dp_list(
         self,
         data_list: Sequence[Any],
         type_hint: TypeHint = None,
         preprocessor: Optional[Preprocessor] = None,
         strict_level_map: Optional[StrictLevelMap] = None,
+        type_counter: Optional[typing.Counter[type[AbstractType]]] = None,
     ) -> list[DataProperty]:
         if is_empty_sequence(data_list):
             return []
 
-        type_counter: typing.Counter[type[AbstractType]] = Counter()
+        return list(
+            self._iter_dp(
+                data_list,
+                type_hint=type_hint,
+                preprocessor=preprocessor,
+                strict_level_map=strict_level_map,
+                type_counter=type_counter,
+            )
+        )
+
+    def _iter_dp(
+        self,
+        data_list: Iterable[Any],
+        type_hint: TypeHint = None,
+        preprocessor: Optional[Preprocessor] = None,
+        strict_level_map: Optional[StrictLevelMap] = None,
+        type_counter: Optional[typing.Counter[type[AbstractType]]] = None,
+    ) -> Iterator[DataProperty]:
+        if type_counter is None:
+            type_counter = Counter()
+
+        if self.__low_cardinality_threshold > 0 and isinstance(data_list, Sequence):
+            encoded = self.__encode_dictionary(data_list)
+
+            if encoded is not None:
+                yield from self.__iter_dp_dictionary(
+                    data_list,
+                    *encoded,
+                    type_hint=type_hint,
+                    preprocessor=preprocessor,
+                    strict_level_map=strict_level_map,
+                    type_counter=type_counter,
+                )
+                return
 
-        dp_list = []
         for data in data_list:
             expect_type_hint: TypeHint = type_hint
-            if type_hint is None:
+            if type_hint is None and not self.__is_trusted_type(data):
                 try:
                     expect_type_hint, _count = type_counter.most_common(1)[0]
                     if not expect_type_hint(
@@ -718,20 +1792,89 @@ class DataPropertyExtractor:
             )
             type_counter[dataprop.type_class] += 1
 
-            dp_list.append(dataprop)
+            yield dataprop
+
+    def __encode_dictionary(self, data_list: Sequence[Any]) -> Optional[tuple[list[int], int]]:
+        code_map: dict[tuple, int] = {}
+        code_list = []
+
+        for data in data_list:
+            value_key = _to_value_key(data)
+            if value_key is None:
+                return None
+
+            code = code_map.setdefault(value_key, len(code_map))
+            if code >= self.__low_cardinality_threshold:
+                return None
+
+            code_list.append(code)
+
+        return (code_list, len(code_map))
+
+    def __iter_dp_dictionary(
+        self,
+        data_list: Sequence[Any],
+        code_list: Sequence[int],
+        code_count: int,
+        type_hint: TypeHint,
+        preprocessor: Optional[Preprocessor],
+        strict_level_map: Optional[StrictLevelMap],
+        type_counter: typing.Counter[type[AbstractType]],
+    ) -> Iterator[DataProperty]:
+        # same as _iter_dp except that type checks and conversions are executed
+        # once for each pair of a distinct value and an expected type hint
+        logger.debug(f"dictionary-encoded: rows={len(code_list)}, distinct_values={code_count}")
+
+        dp_map: dict[tuple[int, TypeHint], DataProperty] = {}
+        is_type_map: dict[tuple[int, TypeHint], bool] = {}
+
+        for data, code in zip(data_list, code_list):
+            expect_type_hint: TypeHint = type_hint
+            if type_hint is None and not self.__is_trusted_type(data):
+                for expect_type_hint, _count in type_counter.most_common(1):
+                    is_type = is_type_map.get((code, expect_type_hint))
+                    if is_type is None:
+                        is_type = expect_type_hint(
+                            data, float_type=self.float_type, strict_level=StrictLevel.MAX
+                        ).is_type()
+                        is_type_map[(code, expect_type_hint)] = is_type
+
+                    if not is_type:
+                        expect_type_hint = None
+
+            dataprop = dp_map.get((code, expect_type_hint))
+            if dataprop is None:
+                dataprop = self.__to_dp(
+                    data=data,
+                    type_hint=expect_type_hint,
+                    preprocessor=preprocessor if preprocessor else self.__preprocessor,
+                    strict_level_map=strict_level_map,
+                )
+                dp_map[(code, expect_type_hint)] = dataprop
+
+            type_counter[dataprop.type_class] += 1
 
-        return dp_list
+            yield dataprop
 
     def __strip_data_matrix(self, data_matrix: Sequence[Sequence[Any]]) -> Sequence[Sequence[Any]]:
-        header_col_size = len(self.headers) if self.headers else 0
         try:
             col_size_list = [len(data_list) for data_list in data_matrix]
         except TypeError:
             return []
 
+        format_col_size = self.__get_format_col_size(col_size_list)
+
+        if self.matrix_formatting == MatrixFormatting.EXCEPTION:
+            return data_matrix
+
+        return self.__format_data_matrix(data_matrix, col_size_list, format_col_size)
+
+    def __get_format_col_size(self, col_size_list: Sequence[int]) -> int:
+        header_col_size = len(self.headers) if self.headers else 0
+
         if self.headers:
-            min_col_size = min([header_col_size] + col_size_list)
-            max_col_size = max([header_col_size] + col_size_list)
+            min_col_size = min([header_col_size] + list(col_size_list))
+            max_col_size = max([header_col_size] + list(col_size_list))
         elif col_size_list:
             min_col_size = min(col_size_list)
             max_col_size = max(col_size_list)
@@ -747,20 +1890,26 @@ class DataPropertyExtractor:
                     )
                 )
 
-            return data_matrix
+            return max_col_size
 
         if self.matrix_formatting == MatrixFormatting.HEADER_ALIGNED:
             if header_col_size > 0:
-                format_col_size = header_col_size
-            else:
-                format_col_size = max_col_size
-        elif self.matrix_formatting == MatrixFormatting.TRIM:
-            format_col_size = min_col_size
-        elif self.matrix_formatting == MatrixFormatting.FILL_NONE:
-            format_col_size = max_col_size
-        else:
-            raise ValueError(f"unknown matrix formatting: {self.matrix_formatting}")
+                return header_col_size
 
+            return max_col_size
+
+        if self.matrix_formatting == MatrixFormatting.TRIM:
+            return min_col_size
+
+        if self.matrix_formatting == MatrixFormatting.FILL_NONE:
+            return max_col_size
+
+        raise ValueError(f"unknown matrix formatting: {self.matrix_formatting}")
+
+    @staticmethod
+    def __format_data_matrix(
+        data_matrix: Sequence[Sequence[Any]], col_size_list: Sequence[int], format_col_size: int
+    ) -> list[list[Any]]:
         return [
             list(data_matrix[row_idx][:format_col_size]) + [None] * (format_col_size - col_size)
             for row_idx, col_size in enumerate(col_size_list)
@@ -771,27 +1920,99 @@ class DataPropertyExtractor:
         col_dp_list = []
 
         for col_idx, header_dp in enumerate(header_dp_list):
-            col_dp = ColumnDataProperty(
-                column_index=col_idx,
-                float_type=self.float_type,
-                min_width=self.min_column_width,
-                format_flags=self.__get_format_flags(col_idx),
-                is_formatting_float=self.is_formatting_float,
-                datetime_format_str=self.datetime_format_str,
-                east_asian_ambiguous_width=self.east_asian_ambiguous_width,
-                max_precision=self.__max_precision,
-            )
+            col_dp = self.__create_col_dp(col_idx)
             col_dp.update_header(header_dp)
             col_dp_list.append(col_dp)
 
         return col_dp_list
 
+    def __create_col_dp(self, col_idx: int) -> ColumnDataProperty:
+        return ColumnDataProperty(
+            column_index=col_idx,
+            float_type=self.float_type,
+            min_width=self.min_column_width,
+            format_flags=self.__get_format_flags(col_idx),
+            is_formatting_float=self.is_formatting_float,
+            datetime_format_str=self.datetime_format_str,
+            east_asian_ambiguous_width=self.east_asian_ambiguous_width,
+            is_grapheme_cluster_aware=self.is_grapheme_cluster_aware,
+            max_precision=self.__max_precision,
+            is_streaming=self.is_streaming_column_profile,
+        )
+
+    def __begin_col_dp_update(
+        self,
+        col_dp_list: list[ColumnDataProperty],
+        col_idx: int,
+        previous_column_dp_list: Optional[Sequence[ColumnDataProperty]],
+    ) -> ColumnDataProperty:
+        try:
+            col_dp_list[col_idx]
+        except IndexError:
+            col_dp_list.append(self.__create_col_dp(col_idx))
+
+        col_dp = col_dp_list[col_idx]
+        col_dp.begin_update()
+
+        try:
+            col_dp.merge(previous_column_dp_list[col_idx])  # type: ignore
+        except (TypeError, IndexError):
+            pass
+
+        return col_dp
+
+    def __update_col_dp_list_by_rows(
+        self,
+        col_dp_list: list[ColumnDataProperty],
+        value_dp_rows: Iterable[Sequence[DataProperty]],
+        previous_column_dp_list: Optional[Sequence[ColumnDataProperty]],
+    ) -> None:
+        updating_col_dp_list: Optional[list[ColumnDataProperty]] = None
+
+        for value_dp_row in value_dp_rows:
+            if updating_col_dp_list is None:
+                updating_col_dp_list = [
+                    self.__begin_col_dp_update(col_dp_list, col_idx, previous_column_dp_list)
+                    for col_idx in range(len(value_dp_row))
+                ]
+
+            for col_dp, value_dp in zip(updating_col_dp_list, value_dp_row):
+                col_dp.update_body(value_dp)
+
+        for col_dp in updating_col_dp_list or []:
+            col_dp.end_update()
+
+            logger.debug(f"    {str(col_dp):s}")
+
+    @staticmethod
+    def __to_cell_preprocessor(
+        preprocessor: Preprocessor, strip_str: Optional[Union[str, bytes]]
+    ) -> Preprocessor:
+        # only a part of preprocessing options apply to each cell
+        return Preprocessor(
+            dequote=preprocessor.dequote,
+            line_break_handling=preprocessor.line_break_handling,
+            line_break_repl=preprocessor.line_break_repl,
+            strip_str=strip_str,
+            is_escape_formula_injection=preprocessor.is_escape_formula_injection,
+            ansi_escape_handling=preprocessor.ansi_escape_handling,
+        )
+
     def __update_dp_converter(self) -> None:
+        # preprocessors shared by all of the cells until the next update
+        self.__cell_preprocessor = self.__to_cell_preprocessor(
+            self.__preprocessor, self.__preprocessor.strip_str
+        )
+        self.__header_preprocessor = self.__to_cell_preprocessor(
+            self.__preprocessor, self.strip_str_header
+        )
+
         preprocessor = Preprocessor(
             line_break_handling=self.__preprocessor.line_break_handling,
             line_break_repl=self.preprocessor.line_break_repl,
             is_escape_html_tag=self.__preprocessor.is_escape_html_tag,
             is_escape_formula_injection=self.__preprocessor.is_escape_formula_injection,
+            ansi_escape_handling=self.__preprocessor.ansi_escape_handling,
         )
         self.__dp_converter = DataPropertyConverter(
             preprocessor=preprocessor,
@@ -801,6 +2022,8 @@ class DataPropertyExtractor:
             datetime_format_str=self.datetime_format_str,
             float_type=self.float_type,
             strict_level_map=self.strict_level_map,
+            east_asian_ambiguous_width=self.east_asian_ambiguous_width,
+            is_grapheme_cluster_aware=self.is_grapheme_cluster_aware,
         )
 
 
@@ -810,8 +2033,92 @@ def _to_dp_list_helper(
     data_list: Sequence[Any],
     type_hint: TypeHint,
     preprocessor: Preprocessor,
+    type_counter: Optional[typing.Counter[type[AbstractType]]] = None,
 ) -> tuple[int, list[DataProperty]]:
     return (
         col_idx,
-        extractor._to_dp_list(data_list, type_hint=type_hint, preprocessor=preprocessor),
+        extractor._to_dp_list(
+            data_list, type_hint=type_hint, preprocessor=preprocessor, type_counter=type_counter
+        ),
+    )
+
+
+_worker_state: Optional[tuple[_ExtractionPlan, DataPropertyExtractor]] = None
+
+
+def _init_worker(plan: _ExtractionPlan) -> DataPropertyExtractor:
+    global _worker_state
+
+    extractor = DataPropertyExtractor._from_plan(plan)
+    _worker_state = (plan, extractor)
+
+    return extractor
+
+
+def _get_worker_extractor(
+    context: Union[_ExtractionPlan, DataPropertyExtractor, None],
+) -> DataPropertyExtractor:
+    if isinstance(context, DataPropertyExtractor):
+        return context
+
+    worker_state = _worker_state
+
+    if worker_state is not None and (context is None or context == worker_state[0]):
+        return worker_state[1]
+
+    assert context
+
+    return _init_worker(context)
+
+
+def _to_column_arrays_chunk_helper(
+    context: Union[_ExtractionPlan, DataPropertyExtractor, None],
+    col_idx: int,
+    data_list: Sequence[Any],
+    type_hint: TypeHint,
+    type_counter: Optional[typing.Counter[type[AbstractType]]],
+) -> tuple[ColumnArrays, typing.Counter[type[AbstractType]]]:
+    # return conversion results as compact arrays to reduce the cost of transferring
+    # the results from worker processes
+    extractor = _get_worker_extractor(context)
+    type_counter = Counter(type_counter)
+    col_arrays = ColumnArrays(
+        column_index=col_idx,
+        float_type=extractor.float_type,
+        datetime_format_str=extractor.datetime_format_str,
+        east_asian_ambiguous_width=extractor.east_asian_ambiguous_width,
+        is_grapheme_cluster_aware=extractor.is_grapheme_cluster_aware,
+        ansi_escape_handling=extractor.preprocessor.ansi_escape_handling,
     )
+
+    for value_dp in extractor._iter_dp(data_list, type_hint=type_hint, type_counter=type_counter):
+        col_arrays.append(value_dp)
+
+    return (col_arrays, type_counter)
+
+
+def _to_value_key(data: Any) -> Optional[tuple]:
+    data_type = type(data)
+
+    if data_type in _EXACT_VALUE_KEY_TYPES:
+        return (data_type, data)
+
+    if data_type in _REPR_VALUE_KEY_TYPES:
+        # equal values may have different representations: e.g. 0.0 and -0.0
+        return (data_type, repr(data))
+
+    return None
+
+
+def _is_process_pool_available() -> bool:
+    try:
+        from _multiprocessing import SemLock, sem_unlink  # noqa
+    except ImportError:
+        logger.debug("This platform lacks a functioning sem_open implementation")
+        return False
+
+    if "pytest" in sys.modules:
+        logger.debug("use a single process to avoid deadlock when executed from pytest")
+        return False
+
+    return True
@@ -2,15 +2,22 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import bisect
 import decimal
+import functools
 import re
+import threading
+from collections.abc import Callable, Iterable
 from decimal import Decimal
-from typing import Any, Final, Optional, Union
+from typing import Any, Final, Optional, Union, cast
 
 from typepy import Integer, RealNumber, TypeConversionError
 
+from ._common import CacheInfo, DefaultValue
+
 
 _ansi_escape: Final = re.compile(r"(\x9b|\x1b\[)[0-?]*[ -\/]*[@-~]", re.IGNORECASE)
+_ANSI_ESCAPE_CHARS: Final = ("\x1b", "\x9b")
 
 
 def get_integer_digit(value: Any) -> int:
@@ -99,18 +106,321 @@ def strip_ansi_escape(unicode_str: str) -> str:
     return _ansi_escape.sub("", unicode_str)
 
 
-def calc_ascii_char_width(unicode_str: str, east_asian_ambiguous_width: int = 1) -> int:
+def _has_ansi_escape_char(unicode_str: str) -> bool:
+    return _ANSI_ESCAPE_CHARS[0] in unicode_str or _ANSI_ESCAPE_CHARS[1] in unicode_str
+
+
+# east asian width classes of characters: each character of a string is translated into
+# one of the classes, then the width of the string is calculated by counting the classes.
+_NARROW_CHAR_CLASS: Final = "\x01"
+_WIDE_CHAR_CLASS: Final = "\x02"
+_AMBIGUOUS_CHAR_CLASS: Final = "\x03"
+_ZERO_WIDTH_CHAR_CLASS: Final = "\x04"
+
+# general categories of the characters that have no width in grapheme clusters:
+# combining marks (including variation selectors) and format characters
+_ZERO_WIDTH_CATEGORIES: Final = ("Mn", "Me", "Cf")
+
+_SOFT_HYPHEN: Final = "\u00ad"
+_ZERO_WIDTH_JOINER: Final = "\u200d"
+_EMOJI_PRESENTATION_SELECTOR: Final = "\ufe0f"
+_REGIONAL_INDICATOR_FIRST: Final = "\U0001f1e6"
+_REGIONAL_INDICATOR_LAST: Final = "\U0001f1ff"
+_EMOJI_MODIFIER_FIRST: Final = "\U0001f3fb"
+_EMOJI_MODIFIER_LAST: Final = "\U0001f3ff"
+
+# ranges of the characters that approximate the Extended_Pictographic property:
+# only these characters are joined by zero width joiners into a cluster (UAX #29 GB11)
+_EXTENDED_PICTOGRAPHIC_RANGES: Final = (
+    ("\u00a9", "\u00a9"),
+    ("\u00ae", "\u00ae"),
+    ("\u203c", "\u203c"),
+    ("\u2049", "\u2049"),
+    ("\u2122", "\u2122"),
+    ("\u2139", "\u2139"),
+    ("\u2194", "\u2199"),
+    ("\u21a9", "\u21aa"),
+    ("\u231a", "\u231b"),
+    ("\u2328", "\u2328"),
+    ("\u2388", "\u2388"),
+    ("\u23cf", "\u23cf"),
+    ("\u23e9", "\u23f3"),
+    ("\u23f8", "\u23fa"),
+    ("\u24c2", "\u24c2"),
+    ("\u25aa", "\u25ab"),
+    ("\u25b6", "\u25b6"),
+    ("\u25c0", "\u25c0"),
+    ("\u25fb", "\u25fe"),
+    ("\u2600", "\u27bf"),
+    ("\u2934", "\u2935"),
+    ("\u2b05", "\u2b07"),
+    ("\u2b1b", "\u2b1c"),
+    ("\u2b50", "\u2b50"),
+    ("\u2b55", "\u2b55"),
+    ("\u3030", "\u3030"),
+    ("\u303d", "\u303d"),
+    ("\u3297", "\u3297"),
+    ("\u3299", "\u3299"),
+    ("\U0001f000", "\U0001f1e5"),
+    ("\U0001f200", "\U0001f3fa"),
+    ("\U0001f400", "\U0001faff"),
+    ("\U0001fc00", "\U0001fffd"),
+)
+_EXTENDED_PICTOGRAPHIC_FIRSTS: Final = tuple(
+    first for first, _last in _EXTENDED_PICTOGRAPHIC_RANGES
+)
+
+# translation tables for the Basic Multilingual Plane of each character classifier:
+# built at the first use
+_bmp_char_class_tables: dict[Callable[[str], str], list[str]] = {}
+_bmp_char_class_table_lock: Final = threading.Lock()
+
+
+def _to_char_class(char: str) -> str:
     import unicodedata
 
-    width = 0
-    for char in unicode_str:
-        char_width = unicodedata.east_asian_width(char)
-        if char_width in "WF":
-            width += 2
-        elif char_width == "A":
-            _validate_eaaw(east_asian_ambiguous_width)
-            width += east_asian_ambiguous_width
-        else:
-            width += 1
+    char_width = unicodedata.east_asian_width(char)
+    if char_width in "WF":
+        return _WIDE_CHAR_CLASS
+    if char_width == "A":
+        return _AMBIGUOUS_CHAR_CLASS
+
+    return _NARROW_CHAR_CLASS
+
+
+def _to_grapheme_char_class(char: str) -> str:
+    import unicodedata
+
+    if char != _SOFT_HYPHEN and (
+        unicodedata.category(char) in _ZERO_WIDTH_CATEGORIES
+        # medial vowels and final consonants of conjoining Hangul jamo
+        or "\u1160" <= char <= "\u11ff"
+        or "\ud7b0" <= char <= "\ud7ff"
+    ):
+        return _ZERO_WIDTH_CHAR_CLASS
+
+    return _to_char_class(char)
+
+
+def _get_bmp_char_class_table(to_char_class: Callable[[str], str]) -> list[str]:
+    table = _bmp_char_class_tables.get(to_char_class)
+    if table is not None:
+        return table
+
+    with _bmp_char_class_table_lock:
+        table = _bmp_char_class_tables.get(to_char_class)
+        if table is None:
+            # publish the table only after it is completely built
+            table = [to_char_class(chr(code)) for code in range(0x10000)]
+            _bmp_char_class_tables[to_char_class] = table
+
+    return table
+
+
+def _to_char_classes(unicode_str: str, to_char_class: Callable[[str], str]) -> str:
+    table = _get_bmp_char_class_table(to_char_class)
+
+    char_classes = unicode_str.translate(table)
+    if char_classes.isascii():
+        return char_classes
+
+    # characters out of the BMP are left as they are by the translation
+    return "".join(
+        char_class if char_class.isascii() else to_char_class(char_class)
+        for char_class in char_classes
+    )
+
+
+def _count_char_class_width(char_classes: str, east_asian_ambiguous_width: int) -> int:
+    width = (
+        len(char_classes)
+        + char_classes.count(_WIDE_CHAR_CLASS)
+        - char_classes.count(_ZERO_WIDTH_CHAR_CLASS)
+    )
+
+    ambiguous_count = char_classes.count(_AMBIGUOUS_CHAR_CLASS)
+    if ambiguous_count:
+        _validate_eaaw(east_asian_ambiguous_width)
+        width += ambiguous_count * (east_asian_ambiguous_width - 1)
 
     return width
+
+
+def _is_extended_pictographic(char: str) -> bool:
+    idx = bisect.bisect_right(_EXTENDED_PICTOGRAPHIC_FIRSTS, char) - 1
+
+    return idx >= 0 and char <= _EXTENDED_PICTOGRAPHIC_RANGES[idx][1]
+
+
+def _calc_grapheme_cluster_width(unicode_str: str, east_asian_ambiguous_width: int) -> int:
+    char_classes = _to_char_classes(unicode_str, _to_grapheme_char_class)
+
+    if (
+        _ZERO_WIDTH_JOINER not in unicode_str
+        and _EMOJI_PRESENTATION_SELECTOR not in unicode_str
+        and max(unicode_str) < _REGIONAL_INDICATOR_FIRST
+    ):
+        # no emoji sequences: the width of each cluster is the width of the base character
+        return _count_char_class_width(char_classes, east_asian_ambiguous_width)
+
+    if _AMBIGUOUS_CHAR_CLASS in char_classes:
+        _validate_eaaw(east_asian_ambiguous_width)
+
+    class_width_map = {
+        _NARROW_CHAR_CLASS: 1,
+        _WIDE_CHAR_CLASS: 2,
+        _AMBIGUOUS_CHAR_CLASS: east_asian_ambiguous_width,
+    }
+    width = 0
+    cluster_width = 0
+    cluster_base = ""  # the first character of the current cluster
+    is_joining = False  # the previous character is a zero width joiner after an emoji
+    is_flag_open = False  # the current cluster is a single regional indicator
+
+    for char, char_class in zip(unicode_str, char_classes):
+        if char == _ZERO_WIDTH_JOINER:
+            is_joining = cluster_width > 0 and _is_extended_pictographic(cluster_base)
+            continue
+
+        if char == _EMOJI_PRESENTATION_SELECTOR:
+            if cluster_width:
+                cluster_width = 2
+            continue
+
+        if is_joining:
+            is_joining = False
+
+            if _is_extended_pictographic(char):
+                # joined to the current cluster, such as the members of a family emoji
+                continue
+
+        if char_class == _ZERO_WIDTH_CHAR_CLASS:
+            continue
+
+        if cluster_width and _EMOJI_MODIFIER_FIRST <= char <= _EMOJI_MODIFIER_LAST:
+            continue
+
+        if _REGIONAL_INDICATOR_FIRST <= char <= _REGIONAL_INDICATOR_LAST:
+            # a pair of regional indicators is a flag
+            if is_flag_open:
+                cluster_width = 2
+                is_flag_open = False
+                continue
+
+            width += cluster_width
+            cluster_width = 1
+            cluster_base = char
+            is_flag_open = True
+            continue
+
+        width += cluster_width
+        cluster_width = class_width_map[char_class]
+        cluster_base = char
+        is_flag_open = False
+
+    return width + cluster_width
+
+
+def _calc_non_ascii_char_width(
+    unicode_str: str, east_asian_ambiguous_width: int, is_grapheme_cluster_aware: bool
+) -> int:
+    if is_grapheme_cluster_aware:
+        return _calc_grapheme_cluster_width(unicode_str, east_asian_ambiguous_width)
+
+    return _count_char_class_width(
+        _to_char_classes(unicode_str, _to_char_class),
+        east_asian_ambiguous_width,
+    )
+
+
+# LRU cache of the widths of non-ASCII strings keyed by
+# (string, ambiguous width, grapheme cluster awareness).
+# widths of ASCII strings are not cached: len() is cheaper than a cache lookup.
+_cached_calc_non_ascii_char_width = functools.lru_cache(
+    maxsize=DefaultValue.ASCII_CHAR_WIDTH_CACHE_SIZE
+)(_calc_non_ascii_char_width)
+
+
+def set_ascii_char_width_cache_size(size: int) -> None:
+    """
+    Set the maximum number of the cached widths of strings.
+    The cache is shared by :py:func:`calc_ascii_char_width`,
+    |DataProperty|, and |ColumnDataProperty|.
+    The cache is cleared by the change of the size.
+
+    :param size: Maximum number of the cache entries. ``0`` disables the cache.
+    :raises ValueError: If the ``size`` is negative.
+    """
+
+    global _cached_calc_non_ascii_char_width
+
+    if size < 0:
+        raise ValueError(f"size must be greater than or equal to zero: actual={size}")
+
+    _cached_calc_non_ascii_char_width = functools.lru_cache(maxsize=size)(
+        _calc_non_ascii_char_width
+    )
+
+
+def get_ascii_char_width_cache_info() -> CacheInfo:
+    """
+    :return: Statistics of the cache of the widths of strings.
+    :rtype: CacheInfo
+    """
+
+    cache_info = _cached_calc_non_ascii_char_width.cache_info()
+
+    return CacheInfo(
+        hits=cache_info.hits,
+        misses=cache_info.misses,
+        maxsize=cast(int, cache_info.maxsize),
+        currsize=cache_info.currsize,
+    )
+
+
+def clear_ascii_char_width_cache() -> None:
+    _cached_calc_non_ascii_char_width.cache_clear()
+
+
+def calc_ascii_char_width(
+    unicode_str: str, east_asian_ambiguous_width: int = 1, is_grapheme_cluster_aware: bool = False
+) -> int:
+    """
+    :param is_grapheme_cluster_aware:
+        If |True|, calculate the width for each grapheme cluster rather than for each character:
+        combining characters, variation selectors, and zero width characters have no width,
+        and emoji presentation sequences, emoji ZWJ sequences,
+        emoji modifier sequences, and flags are two columns wide.
+    :return: Width of the ``unicode_str`` when displayed in a monospaced font.
+    """
+
+    # str.isascii raises TypeError for non-str values
+    if str.isascii(unicode_str):
+        return len(unicode_str)
+
+    return _cached_calc_non_ascii_char_width(
+        unicode_str, east_asian_ambiguous_width, is_grapheme_cluster_aware
+    )
+
+
+def calc_ascii_char_widths(
+    unicode_strs: Iterable[str],
+    east_asian_ambiguous_width: int = 1,
+    is_grapheme_cluster_aware: bool = False,
+) -> list[int]:
+    """
+    Batch version of :py:func:`calc_ascii_char_width` for the strings of a column.
+
+    :return: ASCII character widths of each string.
+    """
+
+    return [
+        (
+            len(unicode_str)
+            if str.isascii(unicode_str)
+            else _cached_calc_non_ascii_char_width(
+                unicode_str, east_asian_ambiguous_width, is_grapheme_cluster_aware
+            )
+        )
+        for unicode_str in unicode_strs
+    ]
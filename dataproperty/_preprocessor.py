@@ -1,15 +1,33 @@
 import html
 import re
+from collections.abc import Callable
 from typing import Any, Final, Optional, Union
 
 from mbstrdecoder import MultiByteStrDecoder
 
-from ._function import strip_ansi_escape
+from ._ansi_escape import AnsiEscapeHandling
+from ._function import _ANSI_ESCAPE_CHARS, _has_ansi_escape_char, strip_ansi_escape
 from ._line_break import LineBreakHandling
 
 
 _RE_LINE_BREAK: Final = re.compile(r"\r\n|\n")
-_RE_FORMULA_PREFIX: Final = re.compile(r"^[-\+=@]")
+_FORMULA_PREFIXES: Final = ("-", "+", "=", "@")
+_QUOTES: Final = ("'", '"')
+_HTML_SPECIAL_CHARS: Final = ("&", "<", ">", '"', "'")
+
+_PARAM_NAMES: Final = frozenset(
+    [
+        "strip_str",
+        "replace_tabs_with_spaces",
+        "tab_length",
+        "line_break_handling",
+        "line_break_repl",
+        "dequote",
+        "is_escape_html_tag",
+        "is_escape_formula_injection",
+        "ansi_escape_handling",
+    ]
+)
 
 
 def normalize_lbh(value: Optional[LineBreakHandling]) -> LineBreakHandling:
@@ -22,7 +40,26 @@ def normalize_lbh(value: Optional[LineBreakHandling]) -> LineBreakHandling:
     return LineBreakHandling[value.upper()]  # type: ignore
 
 
+def normalize_aeh(value: Union[AnsiEscapeHandling, str, None]) -> AnsiEscapeHandling:
+    if isinstance(value, AnsiEscapeHandling):
+        return value
+
+    if value is None:
+        return AnsiEscapeHandling.AUTO
+
+    try:
+        return AnsiEscapeHandling[value.upper()]
+    except (KeyError, AttributeError):
+        raise ValueError(f"unknown ansi_escape_handling: {value}")
+
+
 class Preprocessor:
+    """
+    Preprocessing of string values.
+    The settings are compiled into a function that omits disabled steps
+    when a string is preprocessed for the first time after the settings changed.
+    """
+
     @property
     def line_break_handling(self) -> Optional[LineBreakHandling]:
         return self.__line_break_handling
@@ -31,6 +68,14 @@ class Preprocessor:
     def line_break_handling(self, value: Optional[LineBreakHandling]) -> None:
         self.__line_break_handling = normalize_lbh(value)
 
+    @property
+    def ansi_escape_handling(self) -> AnsiEscapeHandling:
+        return self.__ansi_escape_handling
+
+    @ansi_escape_handling.setter
+    def ansi_escape_handling(self, value: Union[AnsiEscapeHandling, str, None]) -> None:
+        self.__ansi_escape_handling = normalize_aeh(value)
+
     def __init__(
         self,
         strip_str: Optional[Union[str, bytes]] = None,
@@ -41,7 +86,10 @@ class Preprocessor:
         dequote: bool = False,
         is_escape_html_tag: bool = False,
         is_escape_formula_injection: bool = False,
+        ansi_escape_handling: Union[AnsiEscapeHandling, str, None] = None,
     ) -> None:
+        self.__pipeline: Optional[Callable[[str], tuple[str, Optional[str]]]] = None
+
         self.strip_str = strip_str
         self.replace_tabs_with_spaces = replace_tabs_with_spaces
         self.tab_length = tab_length
@@ -50,6 +98,7 @@ class Preprocessor:
         self.dequote = dequote
         self.is_escape_html_tag = is_escape_html_tag
         self.is_escape_formula_injection = is_escape_formula_injection
+        self.ansi_escape_handling = ansi_escape_handling
 
     def __repr__(self) -> str:
         return ", ".join(
@@ -61,9 +110,24 @@ class Preprocessor:
                 f"line_break_repl={self.line_break_repl}",
                 f"escape_html_tag={self.is_escape_html_tag}",
                 f"escape_formula_injection={self.is_escape_formula_injection}",
+                f"ansi_escape_handling={self.ansi_escape_handling}",
             ]
         )
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+
+        if name in _PARAM_NAMES:
+            # invalidate the compiled pipeline
+            super().__setattr__("_Preprocessor__pipeline", None)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # compiled pipelines are not picklable
+        state = self.__dict__.copy()
+        state["_Preprocessor__pipeline"] = None
+
+        return state
+
     def preprocess(self, data: Any) -> tuple:
         data, no_ansi_escape_data = self.__preprocess_string(
             self.__preprocess_data(data, self.strip_str),
@@ -86,31 +150,108 @@ class Preprocessor:
         return is_updated
 
     def __preprocess_string(self, raw_data: Any) -> tuple[Any, Optional[str]]:
-        data = raw_data
+        if not isinstance(raw_data, str):
+            return (raw_data, None)
+
+        pipeline = self.__pipeline
+        if pipeline is None:
+            pipeline = self.__compile()
+            self.__pipeline = pipeline
 
-        if not isinstance(data, str):
-            return (data, None)
+        return pipeline(raw_data)
+
+    def __compile(self) -> Callable[[str], tuple[str, Optional[str]]]:
+        # steps that modify strings only if they include any of the special characters
+        steps: list[Callable[[str], str]] = []
+        special_chars: list[str] = []
+        aeh = self.ansi_escape_handling
+
+        if aeh == AnsiEscapeHandling.STRIP:
+            # strip before the other steps to apply them to the visible characters
+            steps.append(strip_ansi_escape)
+        if aeh != AnsiEscapeHandling.OFF:
+            special_chars.extend(_ANSI_ESCAPE_CHARS)
 
         if self.replace_tabs_with_spaces:
             try:
-                data = data.replace("\t", " " * self.tab_length)
-            except (TypeError, AttributeError, ValueError):
+                spaces = " " * self.tab_length
+            except TypeError:
                 pass
+            else:
+                steps.append(lambda data: data.replace("\t", spaces) if "\t" in data else data)
+                special_chars.append("\t")
 
         if self.is_escape_html_tag:
+            steps.append(html.escape)
+            special_chars.extend(_HTML_SPECIAL_CHARS)
+
+        line_break_step = self.__compile_line_break()
+        if line_break_step is not None:
+            steps.append(line_break_step)
+            special_chars.extend(["\r", "\n"])
+
+        re_special_char = (
+            re.compile("[{}]".format(re.escape("".join(special_chars)))) if special_chars else None
+        )
+        is_detect_ansi_escape = aeh == AnsiEscapeHandling.AUTO
+        is_escape_formula_injection = self.is_escape_formula_injection
+        is_dequote = self.dequote
+
+        def pipeline(data: str) -> tuple[str, Optional[str]]:
+            # plain strings skip the steps after a scan for the special characters
+            if re_special_char is None or re_special_char.search(data) is None:
+                if is_escape_formula_injection and data.startswith(_FORMULA_PREFIXES):
+                    data = "'" + data
+                if is_dequote:
+                    data = self.__dequote(data)
+
+                return (data, data)
+
+            for step in steps:
+                data = step(data)
+
+            if is_escape_formula_injection and data.startswith(_FORMULA_PREFIXES):
+                data = "'" + data
+            if is_dequote:
+                data = self.__dequote(data)
+
+            if is_detect_ansi_escape and _has_ansi_escape_char(data):
+                return (data, strip_ansi_escape(data))
+
+            return (data, data)
+
+        return pipeline
+
+    def __compile_line_break(self) -> Optional[Callable[[str], str]]:
+        lbh = self.line_break_handling
+        line_break_repl = self.line_break_repl
+
+        if lbh == LineBreakHandling.NOP:
+            return None
+
+        if lbh == LineBreakHandling.REPLACE:
             try:
-                data = html.escape(data)
-            except AttributeError:
-                return (data, None)
+                # validate the replacement: raise re.error for an invalid template
+                _RE_LINE_BREAK.sub(line_break_repl, "\n")
+            except (TypeError, AttributeError):
+                return None
 
-        data = self.__process_line_break(data)
-        data = self.__escape_formula_injection(data)
-        data = self.__dequote(data)
+            def replace_line_break(data: str) -> str:
+                if "\n" not in data:
+                    return data
 
-        try:
-            return (data, strip_ansi_escape(data))
-        except TypeError:
-            return (data, None)
+                return _RE_LINE_BREAK.sub(line_break_repl, data)
+
+            return replace_line_break
+
+        if lbh == LineBreakHandling.ESCAPE:
+
+            def escape_line_break(data: str) -> str:
+                return data.replace("\n", "\\n").replace("\r", "\\r")
+
+            return escape_line_break
+
+        raise ValueError(f"unexpected line_break_handling: {lbh}")
 
     @staticmethod
     def __preprocess_data(data: Any, strip_str: Optional[Union[str, bytes]]) -> Any:
@@ -130,44 +271,10 @@ class Preprocessor:
             elif isinstance(strip_str, bytes):
                 return data.strip(MultiByteStrDecoder(strip_str).unicode_str)
 
-    def __dequote(self, s: str) -> str:
-        if not self.dequote or not s:
-            return s
-
-        try:
-            if (s[0] == s[-1]) and s.startswith(("'", '"')):
-                if s.count(s[0]) == 2:
-                    return s[1:-1]
-        except TypeError:
-            pass
+    @staticmethod
+    def __dequote(s: str) -> str:
+        if s and (s[0] == s[-1]) and s.startswith(_QUOTES):
+            if s.count(s[0]) == 2:
+                return s[1:-1]
 
         return s
-
-    def __process_line_break(self, data: str) -> str:
-        lbh = self.line_break_handling
-
-        if lbh == LineBreakHandling.NOP:
-            return data
-
-        try:
-            if lbh == LineBreakHandling.REPLACE:
-                return _RE_LINE_BREAK.sub(self.line_break_repl, data)
-
-            if lbh == LineBreakHandling.ESCAPE:
-                return data.replace("\n", "\\n").replace("\r", "\\r")
-        except (TypeError, AttributeError):
-            return data
-
-        raise ValueError(f"unexpected line_break_handling: {lbh}")
-
-    def __escape_formula_injection(self, data: str) -> str:
-        if not self.is_escape_formula_injection:
-            return data
-
-        try:
-            if _RE_FORMULA_PREFIX.search(data):
-                return "'" + data
-        except (TypeError, AttributeError):
-            return data
-
-        return data
@@ -25,7 +25,8 @@ from typepy import (
     Typecode,
 )
 
-from dataproperty import Align, ColumnDataProperty, DataProperty, Format
+from dataproperty import Align, ColumnDataProperty, DataProperty, Format, MinMaxContainer
+from dataproperty._formatter import Formatter
 
 
 nan = float("nan")
@@ -493,6 +494,55 @@ class Test_ColumnDataPeroperty:
         assert col_dp.minmax_additional_format_len.min_value == 0
         assert col_dp.minmax_additional_format_len.max_value == 0
 
+    def test_normal_update_body_incremental(self):
+        col_dp = ColumnDataProperty(0, float_type=Decimal)
+        col_dp.update_header(DataProperty("a"))
+
+        widths = []
+        for value in [1, 2.25, 100, -1.5, "abcdefgh", -123456.12345]:
+            col_dp.update_body(DataProperty(value))
+            widths.append(col_dp.ascii_char_width)
+
+        assert widths == [1, 4, 6, 6, 8, 13]
+        assert col_dp.typecode == Typecode.STRING
+        assert col_dp.decimal_places == 5
+
+    def test_normal_update_body_shared_instance(self):
+        shared_dp_list = [DataProperty(value) for value in [1.25, "\x1b[31mabc\x1b[0m", 10]]
+        expected = ColumnDataProperty(0, float_type=Decimal)
+        col_dp = ColumnDataProperty(0, float_type=Decimal)
+
+        for _ in range(3):
+            for value_dp in shared_dp_list:
+                expected.update_body(DataProperty(value_dp.data))
+                col_dp.update_body(value_dp)
+
+        assert str(col_dp) == str(expected)
+        assert col_dp.ascii_char_width == expected.ascii_char_width
+        assert col_dp.minmax_decimal_places.value_list == expected.minmax_decimal_places.value_list
+
+    def test_normal_update_decimal_places(self, monkeypatch):
+        make_format_map = Formatter.make_format_map
+        call_count = 0
+
+        def count_make_format_map(*args, **kwargs):
+            nonlocal call_count
+            call_count += 1
+            return make_format_map(*args, **kwargs)
+
+        monkeypatch.setattr(Formatter, "make_format_map", count_make_format_map)
+        col_dp = ColumnDataProperty(0, float_type=Decimal)
+        assert call_count == 1
+
+        # the format map is made again only when the decimal places of the column change
+        for value in [1.5, 2.25, 3.125] + [4.5, 10, 0.25] * 100:
+            col_dp.update_body(DataProperty(value))
+
+        assert col_dp.decimal_places == 3
+        assert col_dp.minmax_decimal_places.min_value == 0
+        assert col_dp.minmax_decimal_places.max_value == 3
+        assert call_count == 4
+
     def test_min_width(self):
         min_width = 100
 
@@ -540,6 +590,87 @@ class Test_ColumnDataPeroperty:
         assert col_dp.ascii_char_width == 0
 
 
+class Test_ColumnDataPeroperty_streaming:
+    DATATIME_DATA = datetime.datetime(2017, 1, 1, 1, 2, 3)
+
+    @pytest.mark.parametrize(
+        ["values", "format_flags"],
+        [
+            [[0, -1.234, 55.55], None],
+            [[1, 2.2, -3, 9.99], None],
+            [[0.01, 2.2, None, 1234567.5], Format.THOUSAND_SEPARATOR],
+            [[-1, -100, 5, 10], None],
+            [[1.5, 1.73456, 2.5], None],
+            [[-0.001, 0.5, "abc"], None],
+            [[0, -1.234, 55.55, "abcdefg"], None],
+            [[inf, None, "inf", 0.1], None],
+            [[nan, 1, "nan"], None],
+            [[True, False, None], None],
+            [[DATATIME_DATA, None, DATATIME_DATA], None],
+            [[DATATIME_DATA, "test", 1.5], None],
+            [[{"a": 1}, {"bbb": 22}], None],
+            [["いろは", "abcde", ""], None],
+            [[tcolor("0", color="red"), tcolor("-1.234", color="yellow"), "abcdefg"], None],
+        ],
+    )
+    @pytest.mark.parametrize("is_formatting_float", [True, False])
+    def test_normal(self, values, format_flags, is_formatting_float):
+        expected = ColumnDataProperty(
+            0,
+            float_type=Decimal,
+            format_flags=format_flags,
+            is_formatting_float=is_formatting_float,
+        )
+        col_dp = ColumnDataProperty(
+            0,
+            float_type=Decimal,
+            format_flags=format_flags,
+            is_formatting_float=is_formatting_float,
+            is_streaming=True,
+        )
+        assert col_dp.is_streaming
+
+        for column in (expected, col_dp):
+            column.update_header(DataProperty("a"))
+            for value in values:
+                column.update_body(DataProperty(value))
+
+        assert col_dp.typecode == expected.typecode
+        assert col_dp.decimal_places == expected.decimal_places
+        assert col_dp.ascii_char_width == expected.ascii_char_width
+        assert col_dp.bit_length == expected.bit_length
+        assert str(col_dp) == str(expected)
+
+    def test_normal_bounded_state(self):
+        col_dp = ColumnDataProperty(0, float_type=Decimal, is_streaming=True)
+
+        for i in range(1000):
+            col_dp.update_body(DataProperty(i + 1 / (i % 7 + 1)))
+            col_dp.update_body(DataProperty(f"s{i}"))
+
+        # only running aggregates are kept regardless of the number of rows
+        assert isinstance(col_dp.minmax_decimal_places, MinMaxContainer)
+        assert col_dp.minmax_decimal_places.min_value == 0
+        assert len(col_dp._ColumnDataProperty__sample_dp_map) == 5
+        assert not col_dp._ColumnDataProperty__dp_map
+
+    def test_normal_merge(self):
+        expected = ColumnDataProperty(0, float_type=Decimal)
+        col_dp = ColumnDataProperty(0, float_type=Decimal)
+        streaming_col_dp = ColumnDataProperty(0, float_type=Decimal, is_streaming=True)
+
+        for value in [1.5, 2.125]:
+            expected.update_body(DataProperty(value))
+            streaming_col_dp.update_body(DataProperty(value))
+        col_dp.update_body(DataProperty(1))
+        expected.update_body(DataProperty(1))
+        col_dp.merge(streaming_col_dp)
+
+        assert col_dp.decimal_places == expected.decimal_places == 3
+        assert col_dp.minmax_decimal_places.min_value == 0
+        assert col_dp.minmax_decimal_places.max_value == 3
+
+
 class Test_ColumnDataPeroperty_dp_to_str:
     def test_normal_0(self):
         col_dp = ColumnDataProperty(0, float_type=Decimal)
@@ -3,11 +3,13 @@
 """
 
 import sys
+from decimal import Decimal
 
 import pytest
 from typepy import Nan
 
 from dataproperty import MinMaxContainer
+from dataproperty._container import ListContainer
 
 
 @pytest.fixture
@@ -150,3 +152,22 @@ class Test_MinMaxContainer_is_same_value:
     )
     def test_normal(self, container, values, expected):
         assert MinMaxContainer(values).is_same_value() == expected
+
+
+class Test_ListContainer_update:
+    @pytest.mark.parametrize(
+        ["values", "expected_min", "expected_max"],
+        [
+            [[], None, None],
+            [[2, None, 1, 3], 1, 3],
+            [[-1.5, 0, -1.25], Decimal("-1.5"), 0],
+        ],
+    )
+    def test_normal(self, values, expected_min, expected_max):
+        container = ListContainer()
+        for value in values:
+            container.update(value)
+
+        assert container.min_value == expected_min
+        assert container.max_value == expected_max
+        assert ListContainer(values).value_list == container.value_list
@@ -8,6 +8,7 @@ import sys
 from decimal import Decimal
 
 import pytest
+import typepy
 from tcolorpy import tcolor
 from typepy import (
     Bool,
@@ -244,6 +245,51 @@ class Test_DataPeroperty_data_typecode:
         assert dp.typecode == expected_typecode
 
 
+class Test_DataPeroperty_get_type_cascade:
+    @pytest.mark.parametrize(
+        ["strict_level_map", "expected"],
+        [
+            [None, DefaultValue.STRICT_LEVEL_MAP[Typecode.INTEGER]],
+            [MIN_STRICT_LEVEL_MAP, StrictLevel.MIN],
+            [{"default": StrictLevel.MAX}, StrictLevel.MAX],
+            [{Typecode.INTEGER: 0, "default": StrictLevel.MAX}, 0],
+        ],
+    )
+    def test_normal(self, strict_level_map, expected):
+        type_cascade = DataProperty._get_type_cascade(strict_level_map)
+
+        assert [type_class for type_class, _strict_level in type_cascade][:2] == [
+            typepy.NoneType,
+            Integer,
+        ]
+        assert dict(type_cascade)[Integer] == expected
+        assert DataProperty._get_type_cascade(strict_level_map) is type_cascade
+
+
+class Test_DataPeroperty_str_preclassifier:
+    @pytest.mark.parametrize(
+        ["value", "is_strict", "expected_data", "expected_typecode"],
+        [
+            ["_1", False, 1, Typecode.INTEGER],
+            ["１２３", False, 123, Typecode.INTEGER],
+            [" 1,000", False, 1000, Typecode.INTEGER],
+            ["-Infinity", False, Decimal("-Infinity"), Typecode.INFINITY],
+            ["tRUE", False, True, Typecode.BOOL],
+            ["tRUE", True, "tRUE", Typecode.STRING],
+            ["::1", False, ipaddress.ip_address("::1"), Typecode.IP_ADDRESS],
+            ["::1", True, "::1", Typecode.STRING],
+            [' {"a": 1}', False, {"a": 1}, Typecode.DICTIONARY],
+            [' {"a": 1}', True, ' {"a": 1}', Typecode.STRING],
+            ["abc", False, "abc", Typecode.STRING],
+        ],
+    )
+    def test_normal(self, value, is_strict, expected_data, expected_typecode):
+        dp = DataProperty(value, strict_level_map=get_strict_level_map(is_strict))
+
+        assert dp.data == expected_data
+        assert dp.typecode == expected_typecode
+
+
 class Test_DataPeroperty_to_str:
     @pytest.mark.parametrize(
         ["value", "type_hint", "is_strict", "expected_data", "expected_str"],
@@ -429,6 +475,56 @@ class Test_DataPeroperty_is_include_ansi_escape:
     def test_normal(self, value, expected_acw):
         assert DataProperty(value).is_include_ansi_escape == expected_acw
 
+    @pytest.mark.parametrize(
+        ["value", "expected_acw", "expected_align", "expected_typecode"],
+        [
+            [tcolor("abc", color="green"), 3, Align.LEFT, Typecode.STRING],
+            [tcolor("吾輩", color="green"), 4, Align.LEFT, Typecode.STRING],
+            [tcolor("-12.30", color="red"), 5, Align.RIGHT, Typecode.REAL_NUMBER],
+            [tcolor("a\tb", color="red"), 4, Align.LEFT, Typecode.STRING],
+        ],
+    )
+    def test_normal_no_ansi_escape_dp(self, value, expected_acw, expected_align, expected_typecode):
+        dp = DataProperty(value, preprocessor=Preprocessor(replace_tabs_with_spaces=False))
+
+        assert dp.is_include_ansi_escape
+        assert dp.ascii_char_width == expected_acw
+        assert dp.align == expected_align
+        assert dp.no_ansi_escape_dp.typecode == expected_typecode
+        assert dp.no_ansi_escape_dp.ascii_char_width == expected_acw
+
+    @pytest.mark.parametrize(
+        ["value", "attr", "expected"],
+        [
+            [tcolor("abc", color="green"), "is_include_ansi_escape", True],
+            [tcolor("abc", color="green"), "ascii_char_width", 3],
+            [tcolor("abc", color="green"), "align", Align.LEFT],
+            [tcolor("a b", color="red"), "ascii_char_width", 3],
+        ],
+    )
+    def test_normal_plain_str_without_no_ansi_escape_dp(self, value, attr, expected):
+        dp = DataProperty(value)
+
+        assert getattr(dp, attr) == expected
+        # the DataProperty without escape sequences is not required for plain strings
+        assert dp._DataProperty__no_ansi_escape_dp is None
+
+    @pytest.mark.parametrize(
+        ["value", "ambiguous_width", "expected"],
+        [
+            ["α \x1b[31m", 1, 2],
+            ["α \x1b[31m", 2, 3],
+            [tcolor("αβ", color="red"), 2, 4],
+        ],
+    )
+    def test_normal_no_ansi_escape_dp_east_asian_ambiguous_width(
+        self, value, ambiguous_width, expected
+    ):
+        dp = DataProperty(value, east_asian_ambiguous_width=ambiguous_width)
+
+        assert dp.ascii_char_width == expected
+        assert dp.no_ansi_escape_dp.ascii_char_width == expected
+
 
 class Test_DataPeroperty_line_break_handling:
     @pytest.mark.parametrize(
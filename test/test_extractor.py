@@ -3,19 +3,25 @@
 """
 
 import datetime
+import itertools
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 
 import pytest
-from typepy import DateTime, RealNumber, String, Typecode
+from typepy import DateTime, Integer, RealNumber, StrictLevel, String, Typecode
 
 from dataproperty import (
     Align,
+    CacheInfo,
     DataPropertyExtractor,
+    ExecutorBackend,
     Format,
     LineBreakHandling,
     MatrixFormatting,
     Preprocessor,
 )
+from dataproperty._extractor import _to_column_arrays_chunk_helper
 
 from .common import get_strict_level_map
 
@@ -95,6 +101,17 @@ class Test_DataPropertyExtractor_to_dp:
         assert dp.typecode == expected_typecode
         assert isinstance(dp.to_str(), str)
 
+    def test_normal_type_value_map_shared(self, dp_extractor):
+        dp_extractor.type_value_map = {Typecode.INFINITY: "INF", Typecode.NAN: None}
+        dp_matrix = dp_extractor.to_dp_matrix([[inf, nan], [inf, nan]])
+
+        assert dp_matrix[0][0] is dp_matrix[1][0]
+        assert dp_matrix[0][0].data == "INF"
+        assert dp_matrix[0][0].typecode == Typecode.STRING
+        assert dp_matrix[0][1] is dp_matrix[1][1]
+        assert dp_matrix[0][1].data is None
+        assert dp_matrix[0][1].typecode == Typecode.NONE
+
     @pytest.mark.parametrize(
         ["value", "datetime_formatter", "datetime_format_str", "is_strict", "expected"],
         [
@@ -151,6 +168,19 @@ class Test_DataPropertyExtractor_to_dp:
 
         assert dp.data == expected
 
+    def test_normal_modify_settings_in_place(self, dp_extractor):
+        assert dp_extractor.to_dp(inf).data == inf
+        assert dp_extractor.to_dp("a").data == "a"
+        assert dp_extractor.to_dp("1").data == 1
+
+        dp_extractor.type_value_map[Typecode.INFINITY] = "INF"
+        dp_extractor.quoting_flags[Typecode.STRING] = True
+        dp_extractor.strict_level_map[Typecode.INTEGER] = StrictLevel.MAX
+
+        assert dp_extractor.to_dp(inf).data == "INF"
+        assert dp_extractor.to_dp("a").data == '"a"'
+        assert dp_extractor.to_dp("1").data == '"1"'
+
 
 class Test_DataPropertyExtractor_to_dp_quoting_flags:
     ALWAYS_QUOTE_FLAG_MAP = {
@@ -181,6 +211,31 @@ class Test_DataPropertyExtractor_to_dp_quoting_flags:
 
         assert dp.data == expected
 
+    @pytest.mark.parametrize(
+        ["quoting_flags", "is_escape_html_tag", "expected"],
+        [
+            [{Typecode.STRING: True}, False, 4],
+            [{Typecode.STRING: False}, True, 2],
+        ],
+    )
+    def test_normal_grapheme_cluster_aware(
+        self, dp_extractor, quoting_flags, is_escape_html_tag, expected
+    ):
+        dp_extractor.quoting_flags = quoting_flags
+        dp_extractor.update_preprocessor(is_escape_html_tag=is_escape_html_tag)
+        dp_extractor.is_grapheme_cluster_aware = True
+        dp = dp_extractor.to_dp("e\u0301e\u0301")
+
+        assert dp.ascii_char_width == expected
+
+    def test_normal_east_asian_ambiguous_width(self, dp_extractor):
+        dp_extractor.quoting_flags = {Typecode.STRING: True}
+        dp_extractor.east_asian_ambiguous_width = 2
+        dp = dp_extractor.to_dp("αβ")
+
+        assert dp.data == '"αβ"'
+        assert dp.ascii_char_width == 6
+
 
 class Test_DataPropertyExtractor_to_dp_matrix:
     @pytest.mark.parametrize(
@@ -297,6 +352,521 @@ class Test_DataPropertyExtractor_to_dp_matrix:
         assert dp_extractor.to_dp_matrix(value) == expected
 
 
+class Test_DataPropertyExtractor_iter_dp_rows:
+    TEST_DATA_MATRIX = [
+        [1, 1.1, "aa", None],
+        [2, "2.2", "bbb", ""],
+        ["3", 3.33, "1", "a"],
+        [4, 4.4, "2", "b"],
+        [5, "inf", "3", nan],
+    ]
+
+    @pytest.mark.parametrize(["chunk_size"], [[1], [2], [5], [100]])
+    def test_normal(self, dp_extractor, chunk_size):
+        expected = dp_extractor.to_dp_matrix(self.TEST_DATA_MATRIX)
+        dp_rows = list(dp_extractor.iter_dp_rows(iter(self.TEST_DATA_MATRIX), chunk_size))
+
+        assert len(dp_rows) == len(expected)
+        for dp_row, expected_row in zip(dp_rows, expected):
+            assert dp_row == list(expected_row)
+            for dp, expected_dp in zip(dp_row, expected_row):
+                assert dp.typecode == expected_dp.typecode
+
+    def test_normal_type_inference_across_chunks(self, dp_extractor):
+        dp_rows = list(dp_extractor.iter_dp_rows([["a"], ["b"], ["c"], ["1"]], chunk_size=1))
+
+        assert [dp_row[0].typecode for dp_row in dp_rows] == [Typecode.STRING] * 4
+
+    def test_normal_lazy(self, dp_extractor):
+        def gen_rows():
+            for i in itertools.count():
+                yield [i, str(i)]
+
+        dp_rows = list(itertools.islice(dp_extractor.iter_dp_rows(gen_rows(), chunk_size=3), 5))
+
+        assert [dp_row[0].data for dp_row in dp_rows] == [0, 1, 2, 3, 4]
+
+    @pytest.mark.parametrize(
+        ["headers", "matrix_formatting", "expected"],
+        [
+            [None, MatrixFormatting.TRIM, 2],
+            [None, MatrixFormatting.FILL_NONE, 3],
+            [["a", "b", "c", "d"], MatrixFormatting.HEADER_ALIGNED, 4],
+        ],
+    )
+    def test_normal_matrix_formatting(self, dp_extractor, headers, matrix_formatting, expected):
+        dp_extractor.headers = headers
+        dp_extractor.matrix_formatting = matrix_formatting
+        dp_rows = list(dp_extractor.iter_dp_rows([[1, 2, 3], [4, 5], [6, 7, 8], [9]], 2))
+
+        assert len(dp_rows) == 4
+        for dp_row in dp_rows:
+            assert len(dp_row) == expected
+
+    def test_exception_matrix_formatting(self, dp_extractor):
+        dp_extractor.matrix_formatting = MatrixFormatting.EXCEPTION
+
+        with pytest.raises(ValueError):
+            list(dp_extractor.iter_dp_rows([[1, 2], [3, 4], [5]], chunk_size=2))
+
+    def test_exception_chunk_size(self, dp_extractor):
+        with pytest.raises(ValueError):
+            list(dp_extractor.iter_dp_rows([[1]], chunk_size=0))
+
+
+class Test_DataPropertyExtractor_to_column_arrays:
+    TEST_DATA_MATRIX = [
+        [1, 1.1, "aa", 1, None, True, inf, nan, DATATIME_DATA],
+        [2, 2.2, "bbb", 2.2, "", False, "inf", "nan", "2017-01-01T01:23:45+0900"],
+        [-3, 3.33, "いろは", -3, "ccc", True, "infinity", "NAN", DATATIME_DATA],
+    ]
+
+    def test_normal(self, dp_extractor):
+        col_arrays_list = dp_extractor.to_column_arrays(self.TEST_DATA_MATRIX)
+        dp_matrix = dp_extractor.to_dp_matrix(self.TEST_DATA_MATRIX)
+
+        assert len(col_arrays_list) == 9
+
+        for col_idx, col_arrays in enumerate(col_arrays_list):
+            assert col_arrays.column_index == col_idx
+            assert len(col_arrays) == 3
+
+            for row_idx, expected in enumerate(row[col_idx] for row in dp_matrix):
+                assert col_arrays.get_typecode(row_idx) == expected.typecode
+                assert col_arrays.typecodes[row_idx] == expected.typecode.value
+                assert col_arrays.ascii_char_widths[row_idx] == expected.ascii_char_width
+
+                dp = col_arrays.get_dp(row_idx)
+                assert dp == expected
+                assert dp.typecode == expected.typecode
+                assert dp.ascii_char_width == expected.ascii_char_width
+                assert dp.integer_digits == expected.integer_digits
+                assert dp.decimal_places == expected.decimal_places
+
+    def test_normal_digits(self, dp_extractor):
+        col_arrays_list = dp_extractor.to_column_arrays([[-1.25, "a"], [100, None]])
+
+        assert list(col_arrays_list[0].values) == [Decimal("-1.25"), 100]
+        assert list(col_arrays_list[0].integer_digits) == [1, 3]
+        assert list(col_arrays_list[0].decimal_places) == [2, 0]
+        assert list(col_arrays_list[0].ascii_char_widths) == [5, 3]
+        assert list(col_arrays_list[1].integer_digits) == [-1, -1]
+        assert list(col_arrays_list[1].decimal_places) == [-1, -1]
+
+    def test_normal_dp_matrix(self, dp_extractor):
+        dp_matrix = dp_extractor.to_dp_matrix(self.TEST_DATA_MATRIX)
+        col_arrays_list = dp_extractor.to_column_arrays(dp_matrix)
+
+        for col_idx, col_arrays in enumerate(col_arrays_list):
+            assert col_arrays.to_dp_list() == [row[col_idx] for row in dp_matrix]
+
+    @pytest.mark.parametrize(["value", "expected"], [[None, []], [[], []], [(), []]])
+    def test_empty(self, dp_extractor, value, expected):
+        assert dp_extractor.to_column_arrays(value) == expected
+
+
+class Test_DataPropertyExtractor_executor:
+    TEST_DATA_MATRIX = [
+        [1, 1.1, "aa", None],
+        [2, "2.2", "bbb", ""],
+        ["3", 3.33, "1", inf],
+    ]
+
+    def test_normal(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with DataPropertyExtractor() as dp_extractor:
+                expected = dp_extractor.to_dp_matrix(self.TEST_DATA_MATRIX)
+
+                dp_extractor.executor = executor
+                assert dp_extractor.executor is executor
+
+                for _ in range(2):
+                    dp_matrix = dp_extractor.to_dp_matrix(self.TEST_DATA_MATRIX)
+                    assert dp_matrix == expected
+
+            # an injected executor is not shut down by the extractor
+            assert executor.submit(sum, [1, 2]).result() == 3
+
+    def test_normal_settings(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            dp_extractor = DataPropertyExtractor()
+            dp_extractor.executor = executor
+            dp_extractor.type_value_map = {Typecode.NONE: "null", Typecode.INFINITY: "INF"}
+            dp_extractor.register_trans_func(trans_func_2)
+            dp_extractor.preprocessor = Preprocessor(dequote=True)
+
+            serial_extractor = DataPropertyExtractor()
+            serial_extractor.type_value_map = {Typecode.NONE: "null", Typecode.INFINITY: "INF"}
+            serial_extractor.register_trans_func(trans_func_2)
+            serial_extractor.preprocessor = Preprocessor(dequote=True)
+
+            for _ in range(2):
+                assert dp_extractor.to_dp_matrix(
+                    self.TEST_DATA_MATRIX
+                ) == serial_extractor.to_dp_matrix(self.TEST_DATA_MATRIX)
+
+                # changes of the settings are reflected to subsequent calls
+                dp_extractor.type_value_map = {}
+                serial_extractor.type_value_map = {}
+
+    def test_normal_plan(self):
+        # reproduce the conversions of worker processes in-process
+        dp_extractor = DataPropertyExtractor()
+        dp_extractor.type_value_map = {Typecode.NONE: "NULL", Typecode.INFINITY: "INF"}
+        dp_extractor.quoting_flags = {Typecode.STRING: True}
+        expected = dp_extractor.to_dp_matrix(self.TEST_DATA_MATRIX)
+
+        plan = dp_extractor._DataPropertyExtractor__create_plan()
+        worker_extractor = DataPropertyExtractor._from_plan(plan)
+        assert worker_extractor.to_dp_matrix(self.TEST_DATA_MATRIX) == expected
+
+        for col_idx, expected_data in [[2, ['"aa"', '"bbb"', '"1"']], [3, ["NULL", "", "INF"]]]:
+            col_arrays, _type_counter = _to_column_arrays_chunk_helper(
+                plan, col_idx, [row[col_idx] for row in self.TEST_DATA_MATRIX], None, None
+            )
+            assert col_arrays.to_dp_list() == [row[col_idx] for row in expected]
+            assert [dp.data for dp in col_arrays.to_dp_list()] == expected_data
+
+    @pytest.mark.parametrize(["row_chunk_size"], [[1], [2], [3], [100]])
+    def test_normal_row_chunk_size(self, row_chunk_size):
+        value_matrix = [
+            ["1", 1, 1],
+            ["1.1", "2", 2],
+            ["2", "3", "a"],
+            ["3", 4.4, "b"],
+            ["4", "5", "c"],
+            [None, 6, "1"],
+            ["5", "6", "d"],
+        ]
+        expected = DataPropertyExtractor().to_dp_matrix(value_matrix)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            dp_extractor = DataPropertyExtractor()
+            dp_extractor.executor = executor
+            dp_extractor.row_chunk_size = row_chunk_size
+            dp_matrix = dp_extractor.to_dp_matrix(value_matrix)
+
+        assert len(dp_matrix) == len(expected)
+        for row, expected_row in zip(dp_matrix, expected):
+            assert [(dp.typecode, dp.data, dp.ascii_char_width) for dp in row] == [
+                (dp.typecode, dp.data, dp.ascii_char_width) for dp in expected_row
+            ]
+
+    @pytest.mark.parametrize(["value", "expected"], [[0, ValueError], [-1, ValueError]])
+    def test_exception_row_chunk_size(self, dp_extractor, value, expected):
+        with pytest.raises(expected):
+            dp_extractor.row_chunk_size = value
+
+    @pytest.mark.parametrize(
+        ["backend", "row_chunk_size", "expected_backend"],
+        [
+            ["thread", None, ExecutorBackend.THREAD],
+            ["THREAD", 2, ExecutorBackend.THREAD],
+            [ExecutorBackend.THREAD, 1, ExecutorBackend.THREAD],
+            ["serial", None, ExecutorBackend.SERIAL],
+            ["process", None, ExecutorBackend.PROCESS],
+        ],
+    )
+    def test_normal_executor_backend(self, backend, row_chunk_size, expected_backend):
+        expected = DataPropertyExtractor().to_dp_matrix(self.TEST_DATA_MATRIX)
+
+        with DataPropertyExtractor() as dp_extractor:
+            dp_extractor.executor_backend = backend
+            dp_extractor.max_workers = 2
+            dp_extractor.row_chunk_size = row_chunk_size
+
+            assert dp_extractor.executor_backend == expected_backend
+            assert dp_extractor.to_dp_matrix(self.TEST_DATA_MATRIX) == expected
+
+    @pytest.mark.parametrize(["is_gil_enabled"], [[True], [False]])
+    def test_normal_auto_executor_backend(self, monkeypatch, is_gil_enabled):
+        monkeypatch.setattr(sys, "_is_gil_enabled", lambda: is_gil_enabled, raising=False)
+        value_matrix = [[i, f"{i}.5", f"s{i}"] for i in range(300)] + self.TEST_DATA_MATRIX
+        expected = DataPropertyExtractor().to_dp_matrix(value_matrix)
+
+        with DataPropertyExtractor() as dp_extractor:
+            dp_extractor.executor_backend = "auto"
+            dp_extractor.max_workers = 2
+
+            assert dp_extractor.to_dp_matrix(value_matrix) == expected
+            assert dp_extractor.to_dp_matrix(
+                self.TEST_DATA_MATRIX
+            ) == DataPropertyExtractor().to_dp_matrix(self.TEST_DATA_MATRIX)
+
+    def test_normal_max_workers(self, dp_extractor):
+        dp_extractor.max_workers = 4
+        # process pools are not used when executed from pytest
+        assert dp_extractor.max_workers == 1
+
+        dp_extractor.executor_backend = ExecutorBackend.THREAD
+        assert dp_extractor.max_workers == 4
+
+    @pytest.mark.parametrize(["value", "expected"], [["unknown", ValueError], [None, ValueError]])
+    def test_exception_executor_backend(self, dp_extractor, value, expected):
+        with pytest.raises(expected):
+            dp_extractor.executor_backend = value
+
+    def test_normal_close(self, dp_extractor):
+        dp_extractor.close()
+        dp_extractor.close()
+
+        assert dp_extractor.to_dp_matrix(self.TEST_DATA_MATRIX)
+
+
+class Test_DataPropertyExtractor_dp_cache:
+    TEST_DATA_MATRIX = [
+        ["ok", 1, 1.5, -0.0, Decimal("1.0"), DATATIME_DATA],
+        ["ng", 2, 1.5, 0.0, Decimal("1.00"), DATATIME_DATA],
+        ["ok", 1, "1.5", -0.0, Decimal("1.0"), "2017-01-02 03:04:05"],
+        ["ok", True, 1.5, 0.0, Decimal("1.00"), DATATIME_DATA],
+    ]
+
+    def test_normal(self, dp_extractor):
+        expected = DataPropertyExtractor().to_dp_matrix(self.TEST_DATA_MATRIX)
+
+        dp_extractor.dp_cache_size = 100
+        for _ in range(2):
+            dp_matrix = dp_extractor.to_dp_matrix(self.TEST_DATA_MATRIX)
+
+            for row, expected_row in zip(dp_matrix, expected):
+                assert [(dp.typecode, repr(dp.data)) for dp in row] == [
+                    (dp.typecode, repr(dp.data)) for dp in expected_row
+                ]
+
+        cache_info = dp_extractor.get_dp_cache_info()
+        assert cache_info.maxsize == 100
+        assert cache_info.currsize == cache_info.misses
+        assert cache_info.hits + cache_info.misses == 48
+        assert cache_info.hits >= 24
+
+    def test_normal_maxsize(self, dp_extractor):
+        dp_extractor.dp_cache_size = 2
+        dp_extractor.to_dp_list(["a", "b", "c", "a"])
+
+        assert dp_extractor.get_dp_cache_info() == CacheInfo(
+            hits=0, misses=4, maxsize=2, currsize=2
+        )
+
+    def test_normal_disabled(self, dp_extractor):
+        dp_extractor.to_dp_list(["a", "a"])
+
+        assert dp_extractor.get_dp_cache_info() == CacheInfo(
+            hits=0, misses=0, maxsize=0, currsize=0
+        )
+
+    def test_normal_clear(self, dp_extractor):
+        dp_extractor.dp_cache_size = 10
+
+        assert dp_extractor.to_dp("a\nb").data == "a\nb"
+        assert dp_extractor.get_dp_cache_info().currsize == 1
+
+        dp_extractor.preprocessor.line_break_handling = LineBreakHandling.ESCAPE
+        assert dp_extractor.to_dp("a\nb").data == "a\\nb"
+
+        dp_extractor.type_value_map = {Typecode.STRING: "string"}
+        assert dp_extractor.get_dp_cache_info().currsize == 0
+        assert dp_extractor.to_dp("a\nb").data == "string"
+
+    @pytest.mark.parametrize(["value", "expected"], [[-1, ValueError]])
+    def test_exception(self, dp_extractor, value, expected):
+        with pytest.raises(expected):
+            dp_extractor.dp_cache_size = value
+
+
+class Test_DataPropertyExtractor_low_cardinality_threshold:
+    TEST_DATA_MATRIX = [
+        ["ok", 1, 1.5, None, "1"],
+        ["ng", 2, 1.5, "", 1],
+        ["ok", 1, "1.5", None, "a"],
+        ["ok", 2, 1.5, "", "1"],
+        ["ng", 1, 1.5, None, 1],
+    ]
+
+    @pytest.mark.parametrize(["threshold"], [[1], [2], [3], [100]])
+    def test_normal(self, dp_extractor, threshold):
+        expected = DataPropertyExtractor().to_dp_matrix(self.TEST_DATA_MATRIX)
+
+        dp_extractor.low_cardinality_threshold = threshold
+        dp_matrix = dp_extractor.to_dp_matrix(self.TEST_DATA_MATRIX)
+
+        for row, expected_row in zip(dp_matrix, expected):
+            assert [(dp.typecode, repr(dp.data)) for dp in row] == [
+                (dp.typecode, repr(dp.data)) for dp in expected_row
+            ]
+
+        assert [str(col_dp) for col_dp in dp_extractor.to_column_dp_list(dp_matrix)] == [
+            str(col_dp) for col_dp in DataPropertyExtractor().to_column_dp_list(expected)
+        ]
+
+    def test_normal_shared_instance(self, dp_extractor):
+        dp_extractor.low_cardinality_threshold = 2
+        dp_matrix = dp_extractor.to_dp_matrix(self.TEST_DATA_MATRIX)
+
+        # encoded: the number of distinct values is less than or equal to the threshold
+        assert dp_matrix[2][0] is dp_matrix[3][0]
+        assert dp_matrix[1][2] is dp_matrix[3][2]
+
+        # not encoded: the number of distinct values exceeds the threshold
+        assert dp_matrix[0][4] is not dp_matrix[3][4]
+
+    @pytest.mark.parametrize(["value", "expected"], [[-1, ValueError]])
+    def test_exception(self, dp_extractor, value, expected):
+        with pytest.raises(expected):
+            dp_extractor.low_cardinality_threshold = value
+
+
+class Test_DataPropertyExtractor_schema_lock:
+    TEST_DATA_MATRIX = [
+        [1, None, "a"],
+        [2, None, "b"],
+        ["3", "", 1],
+        ["a", None, "c"],
+        [4.5, None, "d"],
+    ]
+
+    @pytest.mark.parametrize(
+        ["sample_size", "is_random_sample", "expected"],
+        [
+            [2, False, [Integer, None, String]],
+            [100, False, [Integer, None, String]],
+            [100, True, [Integer, None, String]],
+        ],
+    )
+    def test_normal_lock_schema(self, dp_extractor, sample_size, is_random_sample, expected):
+        assert (
+            dp_extractor.lock_schema(
+                self.TEST_DATA_MATRIX, sample_size=sample_size, is_random_sample=is_random_sample
+            )
+            == expected
+        )
+        assert dp_extractor.locked_type_hints == expected
+        assert dp_extractor.schema_mismatch_counts == [0, 0, 0]
+
+        dp_extractor.unlock_schema()
+        assert dp_extractor.locked_type_hints == []
+        assert dp_extractor.schema_mismatch_counts == []
+
+    def test_normal_column_type_hints(self, dp_extractor):
+        dp_extractor.column_type_hints = [None, None, String]
+
+        assert dp_extractor.lock_schema(self.TEST_DATA_MATRIX) == [Integer, None, None]
+
+    def test_normal_mismatch_counts(self, dp_extractor):
+        expected = DataPropertyExtractor().to_dp_matrix(self.TEST_DATA_MATRIX)
+
+        dp_extractor.lock_schema(self.TEST_DATA_MATRIX, sample_size=2)
+        dp_matrix = dp_extractor.to_dp_matrix(self.TEST_DATA_MATRIX)
+
+        for row, expected_row in zip(dp_matrix, expected):
+            assert row == expected_row
+        assert dp_extractor.schema_mismatch_counts == [2, 0, 1]
+
+        # mismatch counts are accumulated across chunks of a streaming job
+        for _row in dp_extractor.iter_dp_rows(self.TEST_DATA_MATRIX, chunk_size=2):
+            pass
+        assert dp_extractor.schema_mismatch_counts == [4, 0, 2]
+
+        dp_extractor.lock_schema(self.TEST_DATA_MATRIX, sample_size=2)
+        dp_extractor.to_column_arrays(self.TEST_DATA_MATRIX)
+        assert dp_extractor.schema_mismatch_counts == [2, 0, 1]
+
+    @pytest.mark.parametrize(["value", "expected"], [[0, ValueError], [-1, ValueError]])
+    def test_exception(self, dp_extractor, value, expected):
+        with pytest.raises(expected):
+            dp_extractor.lock_schema(self.TEST_DATA_MATRIX, sample_size=value)
+
+
+class Test_DataPropertyExtractor_trust_python_types:
+    @pytest.mark.parametrize(
+        ["value", "float_type", "expected_typecode", "expected_data"],
+        [
+            [1, None, Typecode.INTEGER, 1],
+            [True, None, Typecode.BOOL, True],
+            [1.0, None, Typecode.REAL_NUMBER, Decimal("1.0")],
+            [1.5, float, Typecode.REAL_NUMBER, 1.5],
+            [Decimal("1.5"), None, Typecode.REAL_NUMBER, Decimal("1.5")],
+            [inf, None, Typecode.INFINITY, Decimal("inf")],
+            [None, None, Typecode.NONE, None],
+            [
+                datetime.date(2017, 1, 2),
+                None,
+                Typecode.DATETIME,
+                datetime.datetime(2017, 1, 2),
+            ],
+            ["1", None, Typecode.INTEGER, 1],
+        ],
+    )
+    def test_normal(self, dp_extractor, value, float_type, expected_typecode, expected_data):
+        dp_extractor.trust_python_types = True
+        dp_extractor.float_type = float_type
+        dp = dp_extractor.to_dp(value)
+
+        assert dp.typecode == expected_typecode
+        assert dp.data == expected_data
+
+    def test_normal_type_inference(self, dp_extractor):
+        value_matrix = [[datetime.datetime(2017, 1, 2)], [1.5]]
+
+        assert dp_extractor.to_dp_matrix(value_matrix)[1][0].typecode == Typecode.DATETIME
+
+        dp_extractor.trust_python_types = True
+        assert dp_extractor.to_dp_matrix(value_matrix)[1][0].typecode == Typecode.REAL_NUMBER
+
+    def test_normal_type_hints(self, dp_extractor):
+        dp_extractor.trust_python_types = True
+        dp_extractor.column_type_hints = [String, None]
+        dp_matrix = dp_extractor.to_dp_matrix([[1, 1]])
+
+        assert [dp.typecode for dp in dp_matrix[0]] == [Typecode.STRING, Typecode.INTEGER]
+
+        dp_extractor.default_type_hint = String
+        dp_matrix = dp_extractor.to_dp_matrix([[1, 1]])
+
+        assert [dp.typecode for dp in dp_matrix[0]] == [Typecode.STRING, Typecode.STRING]
+
+
+class Test_DataPropertyExtractor_configure:
+    def test_normal(self, dp_extractor):
+        dp_extractor.configure(
+            type_value_map={Typecode.NONE: "null"},
+            float_type=float,
+            max_precision=3,
+        )
+
+        assert dp_extractor.type_value_map == {Typecode.NONE: "null"}
+        assert dp_extractor.float_type is float
+        assert dp_extractor.max_precision == 3
+        assert dp_extractor.to_dp(None).data == "null"
+        assert dp_extractor.to_dp("1.5").data == 1.5
+
+    def test_normal_batch_update(self, dp_extractor):
+        assert dp_extractor.to_dp(None).data is None
+
+        with dp_extractor.batch_update():
+            dp_extractor.type_value_map = {Typecode.NONE: "null"}
+
+            with dp_extractor.batch_update():
+                dp_extractor.set_type_value(Typecode.INFINITY, "INF")
+
+            dp_extractor.strict_level_map = get_strict_level_map(False)
+
+        assert dp_extractor.to_dp(None).data == "null"
+        assert dp_extractor.to_dp(inf).data == "INF"
+
+    @pytest.mark.parametrize(
+        ["settings"],
+        [
+            [{"not_exist": 1}],
+            [{"float_type": float, "get_dp_cache_info": None}],
+        ],
+    )
+    def test_exception(self, dp_extractor, settings):
+        with pytest.raises(ValueError):
+            dp_extractor.configure(**settings)
+
+        assert dp_extractor.float_type is None
+
+
 class Test_DataPropertyExtractor_to_dp_list:
     @pytest.mark.parametrize(
         ["value", "float_type"], [[[0.1, Decimal("1.1")], float], [[0.1, Decimal("1.1")], Decimal]]
@@ -352,6 +922,21 @@ class Test_DataPropertyExtractor_to_dp_list:
         for dp, expected_value in zip(dp_matrix[0], expected):
             assert dp.data == expected_value
 
+    def test_normal_strip_str_update(self, dp_extractor):
+        value = ['"1"', '"abc"']
+        dp_extractor.headers = value
+        dp_extractor.strip_str_header = '"'
+
+        assert [dp.data for dp in dp_extractor.to_dp_list(value)] == value
+        assert [dp.data for dp in dp_extractor.to_header_dp_list()] == ["1", "abc"]
+
+        # modifications of the preprocessor apply to subsequent conversions
+        dp_extractor.preprocessor.strip_str = '"'
+        assert [dp.data for dp in dp_extractor.to_dp_list(value)] == [1, "abc"]
+
+        dp_extractor.strip_str_header = None
+        assert [dp.data for dp in dp_extractor.to_header_dp_list()] == value
+
     @pytest.mark.parametrize(
         ["value", "line_break_handling", "expected"],
         [
@@ -739,6 +1324,62 @@ class Test_DataPropertyExtractor_to_column_dp_list:
         assert dp.ascii_char_width == 4 * ambiguous_width
         assert dp.decimal_places is None
 
+    @pytest.mark.parametrize(
+        ["is_grapheme_cluster_aware", "expected"], [[True, [5, 3]], [False, [5, 8]]]
+    )
+    def test_normal_grapheme_cluster_aware(self, dp_extractor, is_grapheme_cluster_aware, expected):
+        dp_extractor.headers = ["ascii", "e"]
+        dp_extractor.is_grapheme_cluster_aware = is_grapheme_cluster_aware
+        col_dp_list = dp_extractor.to_column_dp_list(
+            dp_extractor.to_dp_matrix([["abc", "👨\u200d👩\u200d👧"], ["d", "🇯🇵e\u0301"]])
+        )
+
+        assert [col_dp.ascii_char_width for col_dp in col_dp_list] == expected
+
+    @pytest.mark.parametrize(
+        ["headers", "value"],
+        [
+            [["i", "f", "s", "if", "mix", "bool", "inf", "nan", "time"], TEST_DATA_MATRIX],
+            [None, TEST_DATA_MATRIX],
+        ],
+    )
+    def test_normal_streaming_column_profile(self, dp_extractor, headers, value):
+        dp_extractor.headers = headers
+        expected_list = dp_extractor.to_column_dp_list(dp_extractor.to_dp_matrix(value))
+
+        dp_extractor.is_streaming_column_profile = True
+        col_dp_list = dp_extractor.to_column_dp_list(dp_extractor.iter_dp_rows(value, 2))
+
+        assert len(col_dp_list) == len(expected_list)
+        for col_dp, expected in zip(col_dp_list, expected_list):
+            assert col_dp.is_streaming
+            assert str(col_dp) == str(expected)
+            assert col_dp.format_str == expected.format_str
+
+    @pytest.mark.parametrize(
+        ["value", "strict_level_map", "is_formatting_float"],
+        [
+            [[[1.5], [1.73456], [2.5]], None, False],
+            [[["1.5"], ["nan"], ["-12.25"]], {"default": 1}, True],
+            [[["1.5"], ["nan"], ["-12.25"]], {"default": 1}, False],
+        ],
+    )
+    def test_normal_streaming_column_profile_real_number(
+        self, dp_extractor, value, strict_level_map, is_formatting_float
+    ):
+        if strict_level_map:
+            dp_extractor.strict_level_map = strict_level_map
+        dp_extractor.is_formatting_float = is_formatting_float
+        expected_list = dp_extractor.to_column_dp_list(dp_extractor.to_dp_matrix(value))
+
+        dp_extractor.is_streaming_column_profile = True
+        col_dp_list = dp_extractor.to_column_dp_list(dp_extractor.iter_dp_rows(value, 2))
+
+        assert [col_dp.ascii_char_width for col_dp in col_dp_list] == [
+            col_dp.ascii_char_width for col_dp in expected_list
+        ]
+        assert [str(col_dp) for col_dp in col_dp_list] == [str(col_dp) for col_dp in expected_list]
+
     def test_normal_empty_value(self, dp_extractor):
         dp_extractor.headers = ["a", "22", "cccc"]
         col_dp_list = dp_extractor.to_column_dp_list(dp_extractor.to_dp_matrix(None))
@@ -844,3 +1485,74 @@ class Test_DataPropertyExtractor_update_preprocessor:
         assert dp_extractor.preprocessor.line_break_repl == "<br>"
         assert dp_extractor.preprocessor.is_escape_html_tag is True
         assert dp_extractor.preprocessor.is_escape_formula_injection is True
+
+    @pytest.mark.parametrize(
+        ["value", "expected_data", "expected_typecode"],
+        [
+            [0, "0", Typecode.STRING],
+            [1, "1", Typecode.STRING],
+            [2, "2", Typecode.STRING],
+            [True, "True", Typecode.STRING],
+            [None, None, Typecode.NONE],
+            ["", "", Typecode.NULL_STRING],
+        ],
+    )
+    def test_normal_cached_values(self, dp_extractor, value, expected_data, expected_typecode):
+        # values that have prebuilt DataProperty instances are converted with
+        # the updated preprocessor as well as the other values
+        assert dp_extractor.to_dp(value).data == value
+
+        assert dp_extractor.update_preprocessor(is_escape_html_tag=True)
+
+        dp = dp_extractor.to_dp(value)
+        assert dp.data == expected_data
+        assert dp.typecode == expected_typecode
+
+    @pytest.mark.parametrize(
+        ["ansi_escape_handling", "expected_data", "expected_is_include_ansi_escape"],
+        [
+            ["auto", "\x1b[32m-12.3\x1b[0m", True],
+            ["off", "\x1b[32m-12.3\x1b[0m", False],
+            ["strip", Decimal("-12.3"), False],
+        ],
+    )
+    def test_normal_ansi_escape_handling(
+        self, dp_extractor, ansi_escape_handling, expected_data, expected_is_include_ansi_escape
+    ):
+        dp = dp_extractor.to_dp("\x1b[32m-12.3\x1b[0m")
+        assert dp.is_include_ansi_escape is True
+
+        assert dp_extractor.update_preprocessor(ansi_escape_handling=ansi_escape_handling)
+
+        dp = dp_extractor.to_dp("\x1b[32m-12.3\x1b[0m")
+        assert dp.data == expected_data
+        assert dp.is_include_ansi_escape is expected_is_include_ansi_escape
+
+    def test_normal_ansi_escape_handling_off(self):
+        value = "\x1b[31mred\x1b[0m"
+        value_matrix = [[value, "abc"], ["a", "bcd"]]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            dp_extractor = DataPropertyExtractor()
+            dp_extractor.update_preprocessor(ansi_escape_handling="off")
+            dp_extractor.executor = executor
+            dp_extractor.row_chunk_size = 1
+
+            dp_matrix = dp_extractor.to_dp_matrix(value_matrix)
+            assert dp_matrix[0][0].is_include_ansi_escape is False
+            assert dp_matrix[0][0].ascii_char_width == 12
+
+            dp_extractor.headers = ["a", "b"]
+            col_dp_list = dp_extractor.to_column_dp_list(dp_matrix)
+            assert col_dp_list[0].ascii_char_width == 12
+
+        col_arrays = dp_extractor.to_column_arrays(value_matrix)[0]
+        assert col_arrays.get_dp(0).is_include_ansi_escape is False
+        assert col_arrays.get_dp(0).ascii_char_width == 12
+
+        # DataProperty instances created by the converter
+        dp_extractor.quoting_flags = {Typecode.STRING: True}
+        dp = dp_extractor.to_dp(value)
+        assert dp.data == f'"{value}"'
+        assert dp.is_include_ansi_escape is False
+        assert dp.ascii_char_width == 14
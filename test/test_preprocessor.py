@@ -2,9 +2,11 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import pickle
+
 import pytest
 
-from dataproperty import LineBreakHandling, Preprocessor
+from dataproperty import AnsiEscapeHandling, LineBreakHandling, Preprocessor
 
 
 class Test_Preprocessor_update:
@@ -18,6 +20,7 @@ class Test_Preprocessor_update:
         assert preprocessor.dequote is False
         assert preprocessor.is_escape_html_tag is False
         assert preprocessor.is_escape_formula_injection is False
+        assert preprocessor.ansi_escape_handling is AnsiEscapeHandling.AUTO
 
         assert preprocessor.update(
             strip_str='"',
@@ -28,6 +31,7 @@ class Test_Preprocessor_update:
             dequote=True,
             is_escape_html_tag=True,
             is_escape_formula_injection=True,
+            ansi_escape_handling="strip",
         )
         assert preprocessor.strip_str == '"'
         assert preprocessor.replace_tabs_with_spaces is False
@@ -37,6 +41,7 @@ class Test_Preprocessor_update:
         assert preprocessor.dequote is True
         assert preprocessor.is_escape_html_tag is True
         assert preprocessor.is_escape_formula_injection is True
+        assert preprocessor.ansi_escape_handling is AnsiEscapeHandling.STRIP
 
         assert not preprocessor.update(strip_str='"')
         assert preprocessor.update(strip_str="")
@@ -61,6 +66,66 @@ class Test_Preprocessor_preprocess:
         data, no_ansi_escape_data = preprocessor.preprocess(value)
         assert data == expected
 
+    @pytest.mark.parametrize(
+        ["value", "expected", "expected_no_ansi_escape"],
+        [
+            ["abc", "abc", "abc"],
+            ["=a\tb", "'=a  b", "'=a  b"],
+            ['"a<b>"', "&quot;a&lt;b&gt;&quot;", "&quot;a&lt;b&gt;&quot;"],
+            ["a\r\nb\nc", "a<br>b<br>c", "a<br>b<br>c"],
+            ["\x1b[31ma\nb\x1b[0m", "\x1b[31ma<br>b\x1b[0m", "a<br>b"],
+        ],
+    )
+    def test_normal_all(self, value, expected, expected_no_ansi_escape):
+        preprocessor = Preprocessor(
+            line_break_handling=LineBreakHandling.REPLACE,
+            line_break_repl="<br>",
+            dequote=True,
+            is_escape_html_tag=True,
+            is_escape_formula_injection=True,
+        )
+
+        assert preprocessor.preprocess(value) == (expected, expected_no_ansi_escape)
+
+    @pytest.mark.parametrize(
+        ["value", "ansi_escape_handling", "expected"],
+        [
+            ["abc", AnsiEscapeHandling.AUTO, ("abc", "abc")],
+            ["abc", AnsiEscapeHandling.OFF, ("abc", "abc")],
+            ["abc", AnsiEscapeHandling.STRIP, ("abc", "abc")],
+            ["\x1b[31m=a\tb\x1b[0m", "auto", ("\x1b[31m=a  b\x1b[0m", "=a  b")],
+            ["\x1b[31m=a\tb\x1b[0m", "off", ("\x1b[31m=a  b\x1b[0m", "\x1b[31m=a  b\x1b[0m")],
+            ["\x1b[31m=a\tb\x1b[0m", "strip", ("'=a  b", "'=a  b")],
+        ],
+    )
+    def test_normal_ansi_escape_handling(self, value, ansi_escape_handling, expected):
+        preprocessor = Preprocessor(
+            is_escape_formula_injection=True, ansi_escape_handling=ansi_escape_handling
+        )
+
+        assert preprocessor.preprocess(value) == expected
+
+    def test_exception_ansi_escape_handling(self):
+        with pytest.raises(ValueError):
+            Preprocessor(ansi_escape_handling="invalid")
+
+    def test_normal_update(self):
+        preprocessor = Preprocessor()
+        assert preprocessor.preprocess("'a\tb'") == ("'a  b'", "'a  b'")
+
+        preprocessor.tab_length = 4
+        assert preprocessor.preprocess("'a\tb'") == ("'a    b'", "'a    b'")
+
+        preprocessor.update(dequote=True, line_break_handling="escape")
+        assert preprocessor.preprocess("'a\tb'") == ("a    b", "a    b")
+        assert preprocessor.preprocess("a\nb") == ("a\\nb", "a\\nb")
+
+    def test_normal_pickle(self):
+        preprocessor = Preprocessor(dequote=True)
+        preprocessor.preprocess("'a'")
+
+        assert pickle.loads(pickle.dumps(preprocessor)).preprocess("'a'") == ("a", "a")
+
 
 class Test_Preprocessor_preprocess_string:
     @pytest.mark.parametrize(
@@ -3,10 +3,20 @@
 """
 
 import itertools
+import threading
 
 import pytest
 
-from dataproperty import calc_ascii_char_width
+from dataproperty import (
+    CacheInfo,
+    DataProperty,
+    DefaultValue,
+    calc_ascii_char_width,
+    calc_ascii_char_widths,
+    clear_ascii_char_width_cache,
+    get_ascii_char_width_cache_info,
+    set_ascii_char_width_cache_size,
+)
 
 
 nan = float("nan")
@@ -15,7 +25,16 @@ inf = float("inf")
 
 class Test_calc_ascii_char_width:
     @pytest.mark.parametrize(
-        ["value", "expected"], [["吾輩は猫である", 14], ["いaろbはc", 9], ["abcdef", 6], ["", 0]]
+        ["value", "expected"],
+        [
+            ["吾輩は猫である", 14],
+            ["いaろbはc", 9],
+            ["abcdef", 6],
+            ["", 0],
+            ["𠮷野家", 6],
+            ["a😀b", 4],
+            ["ｱｲｳ", 3],
+        ],
     )
     def test_normal(self, value, expected):
         assert calc_ascii_char_width(value) == expected
@@ -40,3 +59,155 @@ class Test_calc_ascii_char_width:
     def test_exception(self, value, expected):
         with pytest.raises(expected):
             calc_ascii_char_width(value)
+
+    @pytest.mark.parametrize(
+        ["value", "ambiguous_width", "expected"],
+        [["abc", 3, 3], ["吾輩", None, 4]],
+    )
+    def test_normal_no_ambiguous(self, value, ambiguous_width, expected):
+        # east_asian_ambiguous_width is only validated when a string has ambiguous characters
+        assert calc_ascii_char_width(value, ambiguous_width) == expected
+
+    @pytest.mark.parametrize(
+        ["value", "ambiguous_width", "expected"],
+        [["α", 3, ValueError], ["aα", 0, ValueError], ["aα", None, ValueError]],
+    )
+    def test_exception_east_asian_ambiguous(self, value, ambiguous_width, expected):
+        with pytest.raises(expected):
+            calc_ascii_char_width(value, ambiguous_width)
+
+
+class Test_calc_ascii_char_width_grapheme_cluster:
+    @pytest.mark.parametrize(
+        ["value", "expected", "expected_code_point"],
+        [
+            ["abc", 3, 3],
+            ["e\u0301", 1, 2],
+            ["\u1100\u1161\u11a8", 2, 4],
+            ["a\u200bb", 2, 3],
+            ["吾輩は猫", 8, 8],
+            ["\u2764", 1, 1],
+            ["\u2764\ufe0f", 2, 2],
+            ["#\ufe0f\u20e3", 2, 3],
+            ["👍🏽", 2, 4],
+            ["👨\u200d👩\u200d👧", 2, 8],
+            ["👩\u200d💻 dev", 6, 9],
+            ["a\u200db", 2, 3],
+            ["👩\u200db", 3, 4],
+            ["a\u200d👩", 3, 4],
+            ["\u2764\ufe0f\u200d🔥", 2, 5],
+            ["🇯🇵", 2, 2],
+            ["🇯🇵🇯", 3, 3],
+            ["\u200d", 0, 1],
+            ["\u00ad", 1, 1],
+        ],
+    )
+    def test_normal(self, value, expected, expected_code_point):
+        assert calc_ascii_char_width(value, is_grapheme_cluster_aware=True) == expected
+        assert calc_ascii_char_width(value) == expected_code_point
+
+    @pytest.mark.parametrize(
+        ["value", "ambiguous_width", "expected"],
+        [["α\u0301👍🏽", 1, 3], ["α\u0301👍🏽", 2, 4]],
+    )
+    def test_normal_east_asian_ambiguous(self, value, ambiguous_width, expected):
+        assert calc_ascii_char_width(value, ambiguous_width, True) == expected
+
+    def test_normal_dataproperty(self):
+        assert DataProperty("e\u0301", is_grapheme_cluster_aware=True).ascii_char_width == 1
+        assert DataProperty("e\u0301").ascii_char_width == 2
+
+    @pytest.mark.parametrize(["value", "ambiguous_width"], [["α👍🏽", 3], ["α\u0301", None]])
+    def test_exception(self, value, ambiguous_width):
+        with pytest.raises(ValueError):
+            calc_ascii_char_width(value, ambiguous_width, True)
+
+
+class Test_calc_ascii_char_widths:
+    @pytest.mark.parametrize(
+        ["values", "ambiguous_width", "expected"],
+        [
+            [["吾輩は猫である", "abcdef", "", "αβ"], 1, [14, 6, 0, 2]],
+            [["吾輩は猫である", "abcdef", "", "αβ"], 2, [14, 6, 0, 4]],
+            [iter(["a😀b"]), 1, [4]],
+            [[], 1, []],
+        ],
+    )
+    def test_normal(self, values, ambiguous_width, expected):
+        assert calc_ascii_char_widths(values, ambiguous_width) == expected
+
+    @pytest.mark.parametrize(
+        ["values", "ambiguous_width", "expected"],
+        [
+            [["abc", b"abc"], 1, TypeError],
+            [["abc", None], 1, TypeError],
+            [["abc", "α"], 3, ValueError],
+        ],
+    )
+    def test_exception(self, values, ambiguous_width, expected):
+        with pytest.raises(expected):
+            calc_ascii_char_widths(values, ambiguous_width)
+
+
+class Test_ascii_char_width_cache:
+    @pytest.fixture(autouse=True)
+    def reset_cache(self):
+        clear_ascii_char_width_cache()
+        yield
+        set_ascii_char_width_cache_size(DefaultValue.ASCII_CHAR_WIDTH_CACHE_SIZE)
+
+    def test_normal(self):
+        assert calc_ascii_char_width("吾輩は猫である") == 14
+        assert calc_ascii_char_width("吾輩は猫である") == 14
+        assert calc_ascii_char_width("αβ", 2) == 4
+        assert calc_ascii_char_width("αβ", 1) == 2
+        assert calc_ascii_char_width("abc") == 3
+
+        assert get_ascii_char_width_cache_info() == CacheInfo(
+            hits=1, misses=3, maxsize=DefaultValue.ASCII_CHAR_WIDTH_CACHE_SIZE, currsize=3
+        )
+
+    def test_normal_shared(self):
+        assert DataProperty("吾輩は猫である").ascii_char_width == 14
+        assert calc_ascii_char_widths(["吾輩は猫である", "いaろbはc"]) == [14, 9]
+
+        cache_info = get_ascii_char_width_cache_info()
+        assert cache_info.hits == 1
+        assert cache_info.currsize == 2
+
+    @pytest.mark.parametrize(["size", "expected"], [[0, 0], [1, 1], [10, 2]])
+    def test_normal_size(self, size, expected):
+        set_ascii_char_width_cache_size(size)
+
+        for value in ["吾輩", "は猫", "吾輩"]:
+            calc_ascii_char_width(value)
+
+        cache_info = get_ascii_char_width_cache_info()
+        assert cache_info.maxsize == size
+        assert cache_info.currsize == expected
+
+    def test_normal_threads(self, monkeypatch):
+        from dataproperty import _function
+
+        # rebuild the translation tables concurrently from scratch
+        monkeypatch.setattr(_function, "_bmp_char_class_tables", {})
+        set_ascii_char_width_cache_size(0)
+        barrier = threading.Barrier(4)
+        results = []
+
+        def calc_width() -> None:
+            barrier.wait()
+            results.append(calc_ascii_char_width("日本語"))
+
+        threads = [threading.Thread(target=calc_width) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [6] * 4
+        assert [len(table) for table in _function._bmp_char_class_tables.values()] == [0x10000]
+
+    def test_exception(self):
+        with pytest.raises(ValueError):
+            set_ascii_char_width_cache_size(-1)